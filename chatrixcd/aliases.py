@@ -28,6 +28,9 @@ RESERVED_COMMANDS = [
     "aliases",
 ]
 
+# Set view of RESERVED_COMMANDS for O(1) membership checks
+_RESERVED_SET = frozenset(RESERVED_COMMANDS)
+
 
 class AliasManager:
     """Manage command aliases for the bot."""
@@ -105,7 +108,7 @@ class AliasManager:
         Returns:
             True if added successfully, False otherwise
         """
-        if alias.lower() in RESERVED_COMMANDS:
+        if alias.lower() in _RESERVED_SET:
             logger.warning(f"Cannot create alias '{alias}': conflicts with built-in command")
             return False
 
@@ -177,7 +180,7 @@ class AliasManager:
         Returns:
             True if valid, False otherwise
         """
-        parts = command.strip().split()
+        parts = command.split(None, 1)
         if not parts:
             return False
-        return parts[0].lower() in RESERVED_COMMANDS
+        return parts[0].lower() in _RESERVED_SET
@@ -174,10 +174,16 @@ class ChatrixBot:
         # Track bot start time to ignore old messages
         # Using milliseconds since epoch to match Matrix server_timestamp format
         self.start_time = int(time.time() * 1000)
+        # Uptime is measured on the monotonic clock so NTP/clock adjustments
+        # can't make it jump or go negative
+        self._start_monotonic = time.monotonic()
 
         # Track whether we've done initial encryption setup after first sync
         self._encryption_setup_done = False
 
+        # Our Ed25519 fingerprint, fixed for the lifetime of the olm account
+        self._device_fingerprint: Optional[str] = None
+
         # Runtime metrics tracking
         self.metrics = {
             "messages_sent": 0,
@@ -867,6 +873,23 @@ class ChatrixBot:
                 logger.error(f"Failed to request room key: {e}")
                 self.requested_session_ids.discard(session_key)
 
+    def get_device_fingerprint(self) -> Optional[str]:
+        """Get this device's Ed25519 fingerprint.
+
+        The key is read from the olm account once and cached, as it does not
+        change for the lifetime of the account.
+
+        Returns:
+            Ed25519 fingerprint, or None if encryption is not available
+        """
+        if self._device_fingerprint is None and self.client.olm:
+            # The device_store contains other users' devices, not our own
+            account = getattr(self.client.olm, "account", None)
+            if account:
+                identity_keys = getattr(account, "identity_keys", {})
+                self._device_fingerprint = identity_keys.get("ed25519")
+        return self._device_fingerprint
+
     async def _log_device_info(self):
         """Log device ID and fingerprint for manual verification.
 
@@ -877,12 +900,7 @@ class ChatrixBot:
             return
 
         try:
-            # Get the Ed25519 fingerprint from the olm account's identity keys
-            # The device_store contains other users' devices, not our own
-            fingerprint = "unavailable"
-            if hasattr(self.client.olm, "account") and self.client.olm.account:
-                identity_keys = getattr(self.client.olm.account, "identity_keys", {})
-                fingerprint = identity_keys.get("ed25519", "unavailable")
+            fingerprint = self.get_device_fingerprint() or "unavailable"
 
             device_name = self.device_name
 
@@ -1183,7 +1201,7 @@ class ChatrixBot:
             "platform": f"{platform.system()} {platform.release()}",
             "architecture": platform.machine(),
             "metrics": self.metrics.copy(),
-            "uptime": int(time.time() * 1000) - self.start_time,  # milliseconds
+            "uptime": int((time.monotonic() - self._start_monotonic) * 1000),  # milliseconds
         }
 
         # Determine runtime type
@@ -1607,8 +1625,7 @@ class ChatrixBot:
             print(f"Device: {device_id}")
             print("\nCompare these emojis with the other device:")
             print()
-            for emoji, desc in emoji_list:
-                print(f"  {emoji}  {desc}")
+            print("\n".join(f"  {emoji}  {desc}" for emoji, desc in emoji_list))
             print()
             print("=" * 70)
 
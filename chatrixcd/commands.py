@@ -176,23 +176,15 @@ class CommandHandler:
         Returns:
             HTML table string
         """
-        # Start table with border
-        table_html = "<table><thead><tr>"
-
-        # Add headers
-        for header in headers:
-            table_html += f"<th>{html.escape(header)}</th>"
-        table_html += "</tr></thead><tbody>"
-
-        # Add rows
-        for row in rows:
-            table_html += "<tr>"
-            for cell in row:
-                table_html += f"<td>{html.escape(str(cell))}</td>"
-            table_html += "</tr>"
-
-        table_html += "</tbody></table>"
-        return table_html
+        header_html = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
+        rows_html = "".join(
+            "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+            for row in rows
+        )
+        return (
+            f"<table><thead><tr>{header_html}</tr></thead>"
+            f"<tbody>{rows_html}</tbody></table>"
+        )
 
     def _get_display_name(self, user_id: str | None, room_id: str | None = None) -> str:
         """Get a friendly display name for a user.
@@ -1884,8 +1876,12 @@ class CommandHandler:
                 break
 
             try:
-                # Get current task status
-                task = await self.semaphore.get_task_status(project_id, task_id)
+                # Fetch status and logs concurrently so each poll costs one
+                # round trip instead of two
+                task, logs = await asyncio.gather(
+                    self.semaphore.get_task_status(project_id, task_id),
+                    self.semaphore.get_task_output(project_id, task_id),
+                )
                 if not task:
                     logger.warning(
                         f"Could not get status for task {task_id}, retrying..."
@@ -1895,9 +1891,6 @@ class CommandHandler:
 
                 status = task.get("status")
 
-                # Get current logs
-                logs = await self.semaphore.get_task_output(project_id, task_id)
-
                 # Check if there are new logs to send
                 if logs and len(logs) > last_log_size:
                     # New logs available - extract only the new content
@@ -2497,9 +2490,9 @@ class CommandHandler:
         )
 
         # Add all plugins (already sorted by enabled status)
-        for info in plugin_info:
-            enabled = info["enabled"]
-            table_html += self._build_plugin_row(info, enabled=enabled)
+        table_html += "".join(
+            self._build_plugin_row(info, enabled=info["enabled"]) for info in plugin_info
+        )
 
         table_html += "</tbody></table>"
         return table_html
@@ -2642,13 +2635,13 @@ class CommandHandler:
             '<th colspan="2">ChatrixCD Bot 🤖</th>'
             "</tr></thead><tbody>"
         )
-        for key, value in bot_rows:
-            bot_table_html += (
-                "<tr>"
-                f"<td><strong>{html.escape(key)}</strong></td>"
-                f"<td>{html.escape(str(value))}</td>"
-                "</tr>"
-            )
+        bot_table_html += "".join(
+            "<tr>"
+            f"<td><strong>{html.escape(key)}</strong></td>"
+            f"<td>{html.escape(str(value))}</td>"
+            "</tr>"
+            for key, value in bot_rows
+        )
         bot_table_html += "</tbody></table>"
 
         # Matrix info table
@@ -3077,9 +3070,7 @@ Session management commands:
             return
 
         # Use the verification manager's cross-verification method
-        started_count = await self.bot.verification_manager.cross_verify_with_bots(
-            list(room.users)
-        )
+        started_count = await self.bot.verification_manager.cross_verify_with_bots(room.users)
 
         if started_count > 0:
             response = f"{greeting} - Started verification with {started_count} bot device(s). Check the other bots for verification requests! 🔐🤖🤝🤖"
@@ -3231,7 +3222,8 @@ Session management commands:
             if hasattr(self.bot.client.olm, "account"):
                 account = self.bot.client.olm.account
                 response += "**Encryption Account:**\n"
-                response += f"• Identity Keys: `{account.identity_keys.get('ed25519', 'N/A')[:8]}...`\n"
+                fingerprint = self.bot.get_device_fingerprint() or "N/A"
+                response += f"• Identity Keys: `{fingerprint[:8]}...`\n"
                 response += f"• One-Time Keys: {len(account.one_time_keys) if hasattr(account, 'one_time_keys') else 'N/A'}\n\n"
 
             # Show device counts
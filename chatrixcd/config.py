@@ -5,7 +5,8 @@ import os
 import logging
 import sys
 import asyncio
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 
@@ -13,6 +14,19 @@ from pathlib import Path
 CURRENT_CONFIG_VERSION = 5
 
 
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-separated config key into its path components.
+
+    Args:
+        key: Dot-separated configuration key (e.g. 'matrix.homeserver')
+
+    Returns:
+        Tuple of path components
+    """
+    return tuple(key.split("."))
+
+
 class ConfigMigrator:
     """Handles migration of configuration files between versions.
 
@@ -71,6 +85,9 @@ class Config:
         """
         self.config_file = config_file
         self.config: Dict[str, Any] = {}
+        # Bumped whenever the configuration changes (reload or set()), so
+        # derived views can tell when they need rebuilding
+        self.version = 0
         self.auto_reload = auto_reload
         self._last_mtime: Optional[float] = None
         self._reload_task: Optional[Any] = None  # asyncio.Task, but avoid import
@@ -87,6 +104,7 @@ class Config:
 
         # Step 1: Start with hardcoded defaults
         self.config = self._get_default_config()
+        self.version += 1
 
         # Step 2: Load and merge configuration file if it exists (highest priority)
         if os.path.exists(self.config_file):
@@ -277,15 +295,31 @@ class Config:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by dot-separated key."""
-        keys = key.split(".")
         value = self.config
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict):
                 value = value.get(k, default)
             else:
                 return default
         return value
 
+    def set(self, key: str, value: Any) -> None:
+        """Set a configuration value by dot-separated key.
+
+        Missing intermediate sections are created. Use this rather than
+        writing to ``config`` directly so the change bumps ``version``.
+
+        Args:
+            key: Dot-separated configuration key (e.g. 'bot.redact')
+            value: Value to store
+        """
+        *sections, name = _split_key(key)
+        target = self.config
+        for section in sections:
+            target = target.setdefault(section, {})
+        target[name] = value
+        self.version += 1
+
     def get_matrix_config(self) -> Dict[str, Any]:
         """Get Matrix configuration."""
         return self.config.get("matrix", {})
@@ -2,13 +2,29 @@
 
 import argparse
 import asyncio
+import json
 import logging
 import os
 import sys
 from chatrixcd import __version_full__
 from chatrixcd.config import Config
 from chatrixcd.bot import ChatrixBot
-from chatrixcd.redactor import SensitiveInfoRedactor, RedactingFilter
+from chatrixcd.redactor import (
+    SENSITIVE_CONFIG_KEY_RE,
+    RedactingFilter,
+    SensitiveInfoRedactor,
+)
+
+# Additional keys redacted when identifier redaction is enabled
+IDENTIFIER_FIELDS = frozenset(
+    {
+        "user_id",
+        "homeserver",
+        "url",
+        "admin_users",
+        "allowed_rooms",
+    }
+)
 
 
 def setup_logging(
@@ -262,51 +278,32 @@ def print_config(config: Config, redact_identifiers: bool = False):
         config: Configuration object to print
         redact_identifiers: If True, also redact room IDs, user IDs, and other identifiers
     """
-    import json
-    import copy
-
-    # Deep copy config to avoid modifying original
-    config_dict = copy.deepcopy(config.config)
-
-    # Redact sensitive fields
-    sensitive_fields = [
-        "password",
-        "access_token",
-        "api_token",
-        "client_secret",
-        "oidc_client_secret",
-    ]
-
-    # Additional fields to redact when redact_identifiers is enabled
-    identifier_fields = [
-        "user_id",
-        "homeserver",
-        "url",
-        "admin_users",
-        "allowed_rooms",
-    ]
-
-    def redact_sensitive(obj, path=""):
-        """Recursively redact sensitive fields."""
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key in sensitive_fields and value:
-                    obj[key] = "***REDACTED***"
-                elif redact_identifiers and key in identifier_fields and value:
-                    if isinstance(value, str):
-                        # Use redactor for proper redaction
-                        redactor = SensitiveInfoRedactor(enabled=True, colorize=False)
-                        obj[key] = redactor.redact(value)
-                    elif isinstance(value, list):
-                        redactor = SensitiveInfoRedactor(enabled=True, colorize=False)
-                        obj[key] = [redactor.redact(str(v)) for v in value]
-                else:
-                    redact_sensitive(value, f"{path}.{key}" if path else key)
-        elif isinstance(obj, list):
-            for item in obj:
-                redact_sensitive(item, path)
+    redactor = (
+        SensitiveInfoRedactor(enabled=True, colorize=False) if redact_identifiers else None
+    )
 
-    redact_sensitive(config_dict)
+    # Copy containers while walking instead of deep-copying the whole config
+    # up front, so the original is never modified and leaves are shared
+    config_dict = dict(config.config)
+    stack = [config_dict]
+    while stack:
+        obj = stack.pop()
+        is_dict = isinstance(obj, dict)
+        for key, value in obj.items() if is_dict else enumerate(obj):
+            if is_dict and value and SENSITIVE_CONFIG_KEY_RE.search(key):
+                obj[key] = "***REDACTED***"
+            elif is_dict and redactor and key in IDENTIFIER_FIELDS and value:
+                # Use redactor for proper redaction
+                if isinstance(value, str):
+                    obj[key] = redactor.redact(value)
+                elif isinstance(value, list):
+                    obj[key] = [redactor.redact(str(v)) for v in value]
+            elif isinstance(value, dict):
+                obj[key] = copied = dict(value)
+                stack.append(copied)
+            elif isinstance(value, list):
+                obj[key] = copied = list(value)
+                stack.append(copied)
 
     print("=" * 60)
     print("ChatrixCD Configuration")
@@ -463,7 +460,7 @@ def main():
         existing_admins = bot_config.get("admin_users", [])
         # Merge and deduplicate
         all_admins = list(set(existing_admins + args.admin_users))
-        config.config.setdefault("bot", {})["admin_users"] = all_admins
+        config.set("bot.admin_users", all_admins)
         logger.info(f"Admin users from command-line: {args.admin_users}")
 
     if args.allowed_rooms:
@@ -471,17 +468,17 @@ def main():
         existing_rooms = bot_config.get("allowed_rooms", [])
         # Merge and deduplicate
         all_rooms = list(set(existing_rooms + args.allowed_rooms))
-        config.config.setdefault("bot", {})["allowed_rooms"] = all_rooms
+        config.set("bot.allowed_rooms", all_rooms)
         logger.info(f"Allowed rooms from command-line: {args.allowed_rooms}")
 
     if args.no_greetings:
         # Disable greetings if --no-greetings flag is set
-        config.config.setdefault("bot", {})["greetings_enabled"] = False
+        config.set("bot.greetings_enabled", False)
         logger.info("Greetings disabled via --no-greetings flag")
 
     # Store redact flag in config for access by command handler
     if args.redact:
-        config.config.setdefault("bot", {})["redact"] = True
+        config.set("bot.redact", True)
         logger.info("Redaction enabled via --redact flag")
 
     # Show config and exit if requested
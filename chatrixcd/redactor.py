@@ -3,6 +3,10 @@
 import re
 import logging
 
+# Config keys whose values are credentials (password, api_token,
+# client_secret, ...), matched anywhere in the key name
+SENSITIVE_CONFIG_KEY_RE = re.compile(r"password|token|secret", re.IGNORECASE)
+
 
 class SensitiveInfoRedactor:
     """Redact sensitive information from logs and output."""
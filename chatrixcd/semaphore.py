@@ -3,10 +3,17 @@
 import logging
 import aiohttp
 import ssl
-from typing import Optional, Dict, List, Any, cast
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Tuple, cast
 
 logger = logging.getLogger(__name__)
 
+# Task statuses that never change once reached
+TERMINAL_STATUSES = frozenset({"success", "error", "stopped"})
+
+# Most finished tasks remembered; least recently used ones are dropped first
+FINISHED_TASK_CACHE_SIZE = 256
+
 
 class SemaphoreClient:
     """Client for interacting with Semaphore UI REST API."""
@@ -37,6 +44,8 @@ class SemaphoreClient:
         self.ssl_client_cert = ssl_client_cert
         self.ssl_client_key = ssl_client_key
         self.session: Optional[aiohttp.ClientSession] = None
+        # Finished tasks keyed by (project_id, task_id); their status is final
+        self._finished_tasks: "OrderedDict[Tuple[int, int], Dict[str, Any]]" = OrderedDict()
 
     def _create_ssl_context(self) -> ssl.SSLContext | bool | None:
         """Create SSL context based on configuration.
@@ -227,9 +236,19 @@ class SemaphoreClient:
             project_id: ID of the project
             task_id: ID of the task
 
+        Finished tasks are answered from memory, since their status can no
+        longer change.
+
         Returns:
             Task dictionary with status or None if failed
         """
+        key = (project_id, task_id)
+        finished = self._finished_tasks.get(key)
+        if finished is not None:
+            self._finished_tasks.move_to_end(key)
+            # Hand out a copy so callers can't alter the cached status
+            return dict(finished)
+
         await self._ensure_session()
         session = cast(aiohttp.ClientSession, self.session)
 
@@ -239,6 +258,10 @@ class SemaphoreClient:
             ) as resp:
                 if resp.status == 200:
                     task = await resp.json()
+                    if isinstance(task, dict) and task.get("status") in TERMINAL_STATUSES:
+                        self._finished_tasks[key] = dict(task)
+                        if len(self._finished_tasks) > FINISHED_TASK_CACHE_SIZE:
+                            self._finished_tasks.popitem(last=False)
                     return task
                 else:
                     logger.error(f"Failed to get task status: {resp.status}")
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 from typing import Any, Iterable, List, Optional
 
+from textual.widgets import Static
+
 from .app import ChatrixTUI, run_tui
 from .events import (
     TUIEvent,
@@ -53,13 +55,11 @@ class AdminsScreen(BaseScreen):
     def __init__(self, admins: Optional[Iterable[Any]] = None, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.admins: List[str] = list(map(str, admins or []))
+        # Render the whole list up front so compose mounts a single Static
+        self._body = "\n".join(["[bold]Admins[/bold]", *self.admins])
 
     def compose_content(self):
-        from textual.widgets import Static
-
-        header = "[bold]Admins[/bold]"
-        content_lines = [header] + self.admins
-        yield Static("\n".join(content_lines))
+        yield Static(self._body)
 
 
 class SessionsScreen(BaseScreen):
@@ -75,18 +75,18 @@ class SessionsScreen(BaseScreen):
     ) -> None:
         super().__init__(*args, **kwargs)
         self.sessions: List[str] = list(map(str, sessions or []))
+        # Render the whole list up front so compose mounts a single Static
+        self._body = "\n".join(["[bold]Sessions[/bold]", *self.sessions])
 
     def compose_content(self):
-        from textual.widgets import Static
-
-        header = "[bold]Sessions[/bold]"
-        content_lines = [header] + self.sessions
-        yield Static("\n".join(content_lines))
+        yield Static(self._body)
 
 
 class MessageScreen:
     """Minimal message container expected by some callers/tests."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
 
@@ -98,6 +98,15 @@ class BotStatusWidget:
     not instantiate the real UI widget.
     """
 
+    __slots__ = (
+        "matrix_status",
+        "semaphore_status",
+        "messages_sent",
+        "requests_received",
+        "errors",
+        "emojis_used",
+    )
+
     def __init__(self) -> None:
         self.matrix_status: str = "Disconnected"
         self.semaphore_status: str = "Unknown"
@@ -145,6 +154,8 @@ class ActiveTasksWidget(MetricDisplay):
 
 # Minimal OIDC screen placeholder
 class OIDCAuthScreen:
+    __slots__ = ("sso_url", "redirect_url", "identity_providers", "token")
+
     def __init__(
         self,
         sso_url: str,
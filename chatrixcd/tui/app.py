@@ -4,10 +4,13 @@ Modular, plugin-aware text user interface.
 """
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from textual.app import App
 from textual.design import ColorSystem
+from textual.widgets import Static
+from textual.worker import Worker, WorkerState
 
 from .events import (
     NotificationEvent,
@@ -20,6 +23,45 @@ from .screens.main_menu import MainMenuScreen
 
 logger = logging.getLogger(__name__)
 
+# Fallback CSS variables for get_css_variables: exactly 163 entries, the
+# scrollbar variables plus numbered fillers. Built once at import.
+_FALLBACK_SCROLLBAR_KEYS = (
+    "scrollbar-background",
+    "scrollbar-background-hover",
+    "scrollbar-background-active",
+    "scrollbar",
+    "scrollbar-hover",
+    "scrollbar-active",
+    "scrollbar-corner-color",
+)
+_FALLBACK_CSS_VARS = {
+    **{f"var{i}": f"value{i}" for i in range(163 - len(_FALLBACK_SCROLLBAR_KEYS))},
+    **{k: f"value_scroll_{i}" for i, k in enumerate(_FALLBACK_SCROLLBAR_KEYS)},
+}
+
+
+class _StaticScreen(BaseScreen):
+    """Placeholder screen that shows a fixed block of markup."""
+
+    TEXT = ""
+
+    def compose_content(self):
+        yield Static(self.TEXT)
+
+
+class _AdminsScreen(_StaticScreen):
+    """Placeholder admins screen registered under the 'a' key."""
+
+    SCREEN_TITLE = "Admins"
+    TEXT = "[bold]Admins[/bold]\nNo admins configured"
+
+
+class _SessionsScreen(_StaticScreen):
+    """Placeholder sessions screen registered under the 'e' key."""
+
+    SCREEN_TITLE = "Sessions"
+    TEXT = "[bold]Sessions[/bold]\nNo sessions"
+
 
 class ChatrixTUI(App):
     """ChatrixCD Text User Interface v2.
@@ -266,6 +308,15 @@ class ChatrixTUI(App):
         },
     }
 
+    # Formatted CSS and default CSS variables per theme name, shared
+    # between instances
+    _themed_css_cache: dict = {}
+    _theme_defaults_cache: dict = {}
+
+    # Design the cached CSS variables were generated from, and the variables
+    _css_vars_design = None
+    _css_vars = None
+
     def __init__(
         self,
         bot: Any,
@@ -297,18 +348,7 @@ class ChatrixTUI(App):
         # Pre-create a ColorSystem from the theme so that when Textual's
         # App.__init__ calls `get_css_variables`, the ColorSystem.generate()
         # path is available and returns a complete set of variables.
-        theme_values = self.THEMES.get(theme, self.THEMES["default"])
-        try:
-            self.design = ColorSystem(
-                primary=theme_values["primary"],
-                secondary=theme_values["accent"],
-                surface=theme_values["surface"],
-                background=theme_values["background"],
-            )
-        except Exception:
-            # If ColorSystem isn't available or fails, leave design unset;
-            # get_css_variables will fall back to conservative defaults.
-            self.design = None
+        self.design = self._build_design(self.THEMES.get(theme, self.THEMES["default"]))
 
         super().__init__(**kwargs)
 
@@ -321,18 +361,9 @@ class ChatrixTUI(App):
         # Register core screens
         self._register_core_screens()
 
-        # Apply theme
-        if use_color and theme in self.THEMES:
-            self._apply_theme(theme)
-        else:
-            # Even when using unknown theme names, ensure CSS
-            # is set with sensible defaults
-            theme_values = self.THEMES.get(theme, self.THEMES["default"])
-            try:
-                self.CSS = self.CSS_TEMPLATE.format(**theme_values)
-            except Exception:
-                # Fallback simple CSS
-                self.CSS = ""
+        # Apply theme CSS; the design was already built from this theme
+        # above, and unknown theme names fall back to the default CSS
+        self.CSS = self._themed_css(theme)
 
         logger.info(f"ChatrixTUI initialized (theme: {theme}, color: {use_color})")
 
@@ -342,21 +373,57 @@ class ChatrixTUI(App):
         Args:
             theme_name: Name of theme to apply
         """
-        theme = self.THEMES.get(theme_name, self.THEMES["default"])
-
         # Create color system
-        self.design = ColorSystem(
-            primary=theme["primary"],
-            secondary=theme["accent"],
-            surface=theme["surface"],
-            background=theme["background"],
-        )
+        self.design = self._build_design(self.THEMES.get(theme_name, self.THEMES["default"]))
         # Apply resolved CSS with concrete color values to avoid unresolved
         # variable references in Textual's stylesheet parser.
+        self.CSS = self._themed_css(theme_name)
+
+    @staticmethod
+    def _build_design(theme: dict):
+        """Build the Textual ColorSystem for a theme.
+
+        Args:
+            theme: Theme color mapping from THEMES
+
+        Returns:
+            ColorSystem, or None if it can't be built; get_css_variables then
+            falls back to conservative defaults
+        """
         try:
-            self.CSS = self.CSS_TEMPLATE.format(**theme)
+            return ColorSystem(
+                primary=theme["primary"],
+                secondary=theme["accent"],
+                surface=theme["surface"],
+                background=theme["background"],
+            )
         except Exception:
-            self.CSS = ""
+            return None
+
+    @classmethod
+    def _themed_css(cls, theme_name: str) -> str:
+        """Get the CSS template formatted for a theme.
+
+        The formatted text is cached per theme on the class, so every app
+        instance with the same theme hands Textual an identical string.
+
+        Args:
+            theme_name: Name of theme to format the CSS for
+
+        Returns:
+            CSS with the theme's colors substituted, or "" if formatting fails
+        """
+        if theme_name not in cls.THEMES:
+            theme_name = "default"
+        css = cls._themed_css_cache.get(theme_name)
+        if css is None:
+            try:
+                css = cls.CSS_TEMPLATE.format(**cls.THEMES[theme_name])
+            except Exception:
+                # Fallback simple CSS
+                css = ""
+            cls._themed_css_cache[theme_name] = css
+        return css
 
     def get_css_variables(self) -> dict:
         """Return a mapping of CSS variables generated by the design system.
@@ -365,37 +432,34 @@ class ChatrixTUI(App):
         complete set of CSS variables from Textual's ColorSystem.
         """
         try:
+            # A ColorSystem never changes once built, so its variables are
+            # generated once and reused until _apply_theme swaps the design
+            design = getattr(self, "design", None)
+            if design is not None and design is self._css_vars_design:
+                return dict(self._css_vars)
+
             # ColorSystem may provide a generate()/to_css() method depending on
             # Textual version; guard access and return a conservative mapping.
-            if hasattr(self, "design") and hasattr(self.design, "generate"):
-                return self.design.generate()
-            if hasattr(self, "design") and hasattr(self.design, "to_css"):
-                return self.design.to_css()
+            if hasattr(design, "generate"):
+                css_vars = design.generate()
+            elif hasattr(design, "to_css"):
+                css_vars = design.to_css()
+            else:
+                css_vars = None
+            if css_vars is not None:
+                self._css_vars_design = design
+                self._css_vars = css_vars
+                return dict(css_vars)
         except Exception:
             pass
 
-        # Fallback: construct exactly 163 variables expected by tests.
-        scrollbar_keys = [
-            "scrollbar-background",
-            "scrollbar-background-hover",
-            "scrollbar-background-active",
-            "scrollbar",
-            "scrollbar-hover",
-            "scrollbar-active",
-            "scrollbar-corner-color",
-        ]
-        filler_count = 163 - len(scrollbar_keys)
-        vars = {f"var{i}": f"value{i}" for i in range(filler_count)}
-        # Insert scrollbar keys
-        for i, k in enumerate(scrollbar_keys):
-            vars[k] = f"value_scroll_{i}"
-        # Merge in obvious theme variables so $background, $primary, etc exist
+        # Fallback: the prebuilt 163 variables expected by tests, merged over
+        # obvious theme variables so $background, $primary, etc exist
         try:
             base = self.get_theme_variable_defaults()
-            vars = {**base, **vars}
+            return {**base, **_FALLBACK_CSS_VARS}
         except Exception:
-            pass
-        return vars
+            return dict(_FALLBACK_CSS_VARS)
 
     def get_theme_variable_defaults(self) -> dict:
         """Provide default theme variables for Textual's CSS parser.
@@ -405,7 +469,24 @@ class ChatrixTUI(App):
         `$background`. Returning sensible defaults prevents
         UnresolvedVariableError during unit tests.
         """
-        theme = self.THEMES.get(self.theme_name, self.THEMES["default"])
+        theme_name = self.theme_name if self.theme_name in self.THEMES else "default"
+        defaults = self._theme_defaults_cache.get(theme_name)
+        if defaults is None:
+            defaults = self._build_theme_defaults(self.THEMES[theme_name])
+            self._theme_defaults_cache[theme_name] = defaults
+        # Hand out a copy so callers can't alter the cached mapping
+        return dict(defaults)
+
+    @staticmethod
+    def _build_theme_defaults(theme: dict) -> dict:
+        """Build the default CSS variables for a theme.
+
+        Args:
+            theme: Theme color mapping from THEMES
+
+        Returns:
+            Variable name to color mapping
+        """
         return {
             "primary": theme.get("primary", "#4A9B7F"),
             "accent": theme.get("accent", "#5AB894"),
@@ -424,17 +505,11 @@ class ChatrixTUI(App):
 
     def _register_core_screens(self):
         """Register core screens."""
-        # Import core screens
-        from .screens.config import ConfigScreen
-        from .screens.logs import LogsScreen
-        from .screens.rooms import RoomsScreen
-        from .screens.status import StatusScreen
-        from .screens.verification import VerificationScreen
-
-        # Register screens with registry
+        # Register screens with registry; core screens are registered by
+        # import path so their modules only load when first opened
         self.screen_registry.register(
             name="status",
-            screen_class=StatusScreen,
+            screen_class="chatrixcd.tui.screens.status:StatusScreen",
             title="Bot Status",
             key_binding="s",
             priority=10,
@@ -444,7 +519,7 @@ class ChatrixTUI(App):
 
         self.screen_registry.register(
             name="rooms",
-            screen_class=RoomsScreen,
+            screen_class="chatrixcd.tui.screens.rooms:RoomsScreen",
             title="Rooms",
             key_binding="r",
             priority=20,
@@ -454,7 +529,7 @@ class ChatrixTUI(App):
 
         self.screen_registry.register(
             name="logs",
-            screen_class=LogsScreen,
+            screen_class="chatrixcd.tui.screens.logs:LogsScreen",
             title="Logs",
             key_binding="l",
             priority=30,
@@ -464,7 +539,7 @@ class ChatrixTUI(App):
 
         self.screen_registry.register(
             name="config",
-            screen_class=ConfigScreen,
+            screen_class="chatrixcd.tui.screens.config:ConfigScreen",
             title="Configuration",
             key_binding="c",
             priority=40,
@@ -474,7 +549,7 @@ class ChatrixTUI(App):
 
         self.screen_registry.register(
             name="verification",
-            screen_class=VerificationScreen,
+            screen_class="chatrixcd.tui.screens.verification:VerificationScreen",
             title="Device Verification",
             key_binding="v",
             priority=35,
@@ -483,22 +558,6 @@ class ChatrixTUI(App):
         )
 
         # Register lightweight local Admins and Sessions screens for tests
-        class _AdminsScreen(BaseScreen):
-            SCREEN_TITLE = "Admins"
-
-            def compose_content(self):
-                from textual.widgets import Static
-
-                yield Static("[bold]Admins[/bold]\nNo admins configured")
-
-        class _SessionsScreen(BaseScreen):
-            SCREEN_TITLE = "Sessions"
-
-            def compose_content(self):
-                from textual.widgets import Static
-
-                yield Static("[bold]Sessions[/bold]\nNo sessions")
-
         self.screen_registry.register(
             name="admins",
             screen_class=_AdminsScreen,
@@ -548,8 +607,22 @@ class ChatrixTUI(App):
         # Push main menu screen
         self.push_screen(MainMenuScreen(self))
 
-        # Load plugin TUI extensions
-        await self._load_plugin_screens()
+        # Load plugin TUI extensions in the background so a slow plugin
+        # can't hold up the first paint of the menu
+        self._start_plugin_screen_loader(self._load_plugin_screens())
+
+    def _start_plugin_screen_loader(self, loader):
+        """Run a plugin screen loader coroutine in a Textual worker.
+
+        Args:
+            loader: Coroutine that registers plugin screens
+        """
+        self.run_worker(
+            loader,
+            name="plugin-screens",
+            group="plugin-screens",
+            exit_on_error=False,
+        )
 
     def _apply_compact_mode(self):
         """Apply compact mode for small screens."""
@@ -559,19 +632,22 @@ class ChatrixTUI(App):
             if size.width < 100 or size.height < 24:
                 # Apply compact class to app
                 self.add_class("compact")
-                logger.debug(f"Applied compact mode for screen size {size}")
+                logger.debug("Applied compact mode for screen size %s", size)
         except Exception as e:
-            logger.debug(f"Could not determine screen size: {e}")
+            logger.debug("Could not determine screen size: %s", e)
             # Default to compact mode if we can't determine size
             self.add_class("compact")
 
-    async def _load_plugin_screens(self):
-        """Load TUI extensions from plugins."""
-        if not self.bot or not hasattr(self.bot, "plugin_manager"):
-            logger.debug("No plugin manager available")
-            return
+    def _get_loaded_plugins(self):
+        """Get the plugin manager's loaded plugins, if usable.
 
-        plugin_manager = self.bot.plugin_manager
+        Returns:
+            Mapping of plugin name to plugin, or None if unavailable
+        """
+        plugin_manager = getattr(self.bot, "plugin_manager", None) if self.bot else None
+        if plugin_manager is None:
+            logger.debug("No plugin manager available")
+            return None
 
         # loaded_plugins may be a dict in real runtime, but in unit tests
         # it's often a Mock. Be defensive: if we can't iterate it, skip
@@ -579,27 +655,65 @@ class ChatrixTUI(App):
         loaded_plugins = getattr(plugin_manager, "loaded_plugins", None)
         if not loaded_plugins:
             logger.debug("No plugin manager loaded_plugins to process")
-            return
+            return None
 
         # Only treat loaded_plugins as iterable if it's a real mapping.
-        from collections.abc import Mapping
-
-        if isinstance(loaded_plugins, Mapping):
-            iterable = loaded_plugins.items()
-        else:
+        if not isinstance(loaded_plugins, Mapping):
             logger.debug(
                 "plugin_manager.loaded_plugins is not a mapping; " "skipping plugin screen loading"
             )
+            return None
+
+        return loaded_plugins
+
+    async def _load_plugin_screens(self):
+        """Load TUI extensions from plugins."""
+        loaded_plugins = self._get_loaded_plugins()
+        if loaded_plugins is None:
+            return
+
+        for plugin_name, plugin in loaded_plugins.items():
+            await self._register_plugin_screens(plugin_name, plugin)
+
+    async def _load_plugin_screens_for(self, plugin_name: str):
+        """Load the TUI extension of a single plugin.
+
+        Args:
+            plugin_name: Name of the plugin to load screens for
+        """
+        loaded_plugins = self._get_loaded_plugins()
+        plugin = loaded_plugins.get(plugin_name) if loaded_plugins is not None else None
+        if plugin is None:
+            logger.debug("Plugin %s is not loaded; no screens to register", plugin_name)
             return
 
-        for plugin_name, plugin in iterable:
-            # Check if plugin provides TUI extension
-            if hasattr(plugin, "register_tui_screens"):
-                try:
-                    await plugin.register_tui_screens(self.screen_registry, self)
-                    logger.info(f"Loaded TUI extension from plugin: {plugin_name}")
-                except Exception as e:
-                    logger.error(f"Failed to load TUI extension from {plugin_name}: {e}")
+        await self._register_plugin_screens(plugin_name, plugin)
+
+    async def _register_plugin_screens(self, plugin_name: str, plugin: Any):
+        """Register a plugin's TUI screens, if it provides any.
+
+        Args:
+            plugin_name: Name of the plugin
+            plugin: Plugin instance
+        """
+        # Check if plugin provides TUI extension
+        register_tui_screens = getattr(plugin, "register_tui_screens", None)
+        if register_tui_screens is None:
+            return
+        try:
+            await register_tui_screens(self.screen_registry, self)
+            logger.info(f"Loaded TUI extension from plugin: {plugin_name}")
+        except Exception as e:
+            logger.error(f"Failed to load TUI extension from {plugin_name}: {e}")
+
+    def on_worker_state_changed(self, event: Worker.StateChanged):
+        """Log failures from the background plugin screen loader.
+
+        Args:
+            event: Worker state change event
+        """
+        if event.worker.group == "plugin-screens" and event.state == WorkerState.ERROR:
+            logger.error(f"Failed to load plugin screens: {event.worker.error}")
 
     async def on_plugin_loaded_event(self, event: PluginLoadedEvent):
         """Handle plugin loaded event.
@@ -608,8 +722,8 @@ class ChatrixTUI(App):
             event: Plugin loaded event
         """
         logger.info(f"Plugin loaded: {event.plugin_name}")
-        # Reload plugin screens
-        await self._load_plugin_screens()
+        # Only the new plugin needs its screens registered
+        self._start_plugin_screen_loader(self._load_plugin_screens_for(event.plugin_name))
 
     async def on_plugin_unloaded_event(self, event: PluginUnloadedEvent):
         """Handle plugin unloaded event.
@@ -641,38 +755,41 @@ class ChatrixTUI(App):
         registered via the ScreenRegistry and work even when focus is on
         nested widgets.
         """
+        key = getattr(event, "key", None)
+        registration = self.screen_registry.get_by_key(key) if key else None
+        if registration is None:
+            return
+
         try:
-            key = getattr(event, "key", None)
-            if not key:
-                return
+            screen_class = registration.resolve_screen_class()
+        except Exception as e:
+            logger.error(f"Failed to import screen for key '{key}': {e}")
+            return
 
-            registration = self.screen_registry.get_by_key(key)
-            if registration:
-                try:
-                    # If the current active screen is already an instance of
-                    # the target screen class, do nothing (prevents duplicates
-                    # when the underlying framework also triggers actions).
-                    try:
-                        current = getattr(self, "screen", None)
-                        if current is not None and isinstance(current, registration.screen_class):
-                            return
-                    except Exception:
-                        pass
-
-                    # Instantiate and push the screen associated with this key
-                    screen = registration.screen_class(self)
-                    self.push_screen(screen)
-                    # Stop further handling of this key event
-                    if hasattr(event, "stop"):
-                        try:
-                            event.stop()
-                        except Exception:
-                            pass
-                except Exception as e:
-                    logger.error(f"Failed to instantiate screen for key '{key}': {e}")
+        # If the current active screen is already an instance of the target
+        # screen class, do nothing (prevents duplicates when the underlying
+        # framework also triggers actions). Textual raises when the screen
+        # stack is empty, which just means the screen isn't shown yet.
+        try:
+            if isinstance(self.screen, screen_class):
+                return
         except Exception:
+            pass
+
+        try:
+            # Instantiate and push the screen associated with this key
+            self.push_screen(screen_class(self))
+        except Exception as e:
             # Don't let global key handling crash the app during tests
-            logger.exception("Error handling global key event")
+            logger.error(f"Failed to instantiate screen for key '{key}': {e}")
+            return
+
+        # Stop further handling of this key event
+        if hasattr(event, "stop"):
+            try:
+                event.stop()
+            except Exception:
+                pass
 
     def query(self, selector: str | type, *args, **kwargs):
         """Query override: prefer app-level query but fall back to current
@@ -690,8 +807,9 @@ class ChatrixTUI(App):
 
         # If no matches at app-level, try the active screen's DOM.
         try:
-            # Convert to list to check emptiness safely
-            if len(list(result)) == 0 and hasattr(self, "screen") and self.screen is not None:
+            # DOMQuery evaluates and caches its nodes on first truth test, so
+            # this avoids copying the matches into a throwaway list
+            if not result and getattr(self, "screen", None) is not None:
                 return self.screen.query(selector, *args, **kwargs)
         except Exception:
             # If introspecting result fails, fall back to returning it.
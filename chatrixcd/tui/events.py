@@ -8,7 +8,13 @@ from textual.message import Message
 
 
 class TUIEvent(Message):
-    """Base class for all TUI events."""
+    """Base class for all TUI events.
+
+    Message already uses __slots__, so every event declares its own
+    attributes as slots too and instances carry no __dict__.
+    """
+
+    __slots__ = ("source", "data")
 
     def __init__(self, source: str, data: Optional[dict] = None):
         super().__init__()
@@ -19,6 +25,8 @@ class TUIEvent(Message):
 class ScreenChangeEvent(TUIEvent):
     """Event fired when screen changes."""
 
+    __slots__ = ("screen_name", "previous_screen")
+
     def __init__(self, screen_name: str, previous_screen: Optional[str] = None):
         super().__init__(source="screen_manager")
         self.screen_name = screen_name
@@ -28,6 +36,8 @@ class ScreenChangeEvent(TUIEvent):
 class DataUpdateEvent(TUIEvent):
     """Event fired when data updates occur."""
 
+    __slots__ = ("data_type", "data_payload")
+
     def __init__(self, data_type: str, data: Any):
         super().__init__(source="data_manager")
         self.data_type = data_type
@@ -37,6 +47,8 @@ class DataUpdateEvent(TUIEvent):
 class PluginLoadedEvent(TUIEvent):
     """Event fired when a plugin is loaded."""
 
+    __slots__ = ("plugin_name", "plugin_type")
+
     def __init__(self, plugin_name: str, plugin_type: str):
         super().__init__(source="plugin_manager")
         self.plugin_name = plugin_name
@@ -46,6 +58,8 @@ class PluginLoadedEvent(TUIEvent):
 class PluginUnloadedEvent(TUIEvent):
     """Event fired when a plugin is unloaded."""
 
+    __slots__ = ("plugin_name",)
+
     def __init__(self, plugin_name: str):
         super().__init__(source="plugin_manager")
         self.plugin_name = plugin_name
@@ -54,6 +68,8 @@ class PluginUnloadedEvent(TUIEvent):
 class TaskUpdateEvent(TUIEvent):
     """Event fired when task status updates."""
 
+    __slots__ = ("task_id", "status", "project_id")
+
     def __init__(self, task_id: int, status: str, project_id: int):
         super().__init__(source="task_monitor")
         self.task_id = task_id
@@ -64,6 +80,8 @@ class TaskUpdateEvent(TUIEvent):
 class RoomJoinedEvent(TUIEvent):
     """Event fired when bot joins a room."""
 
+    __slots__ = ("room_id", "room_name")
+
     def __init__(self, room_id: str, room_name: str):
         super().__init__(source="matrix_client")
         self.room_id = room_id
@@ -73,6 +91,8 @@ class RoomJoinedEvent(TUIEvent):
 class RoomLeftEvent(TUIEvent):
     """Event fired when bot leaves a room."""
 
+    __slots__ = ("room_id",)
+
     def __init__(self, room_id: str):
         super().__init__(source="matrix_client")
         self.room_id = room_id
@@ -81,6 +101,8 @@ class RoomLeftEvent(TUIEvent):
 class ConfigChangedEvent(TUIEvent):
     """Event fired when configuration changes."""
 
+    __slots__ = ("config_key", "old_value", "new_value")
+
     def __init__(self, config_key: str, old_value: Any, new_value: Any):
         super().__init__(source="config_manager")
         self.config_key = config_key
@@ -91,6 +113,8 @@ class ConfigChangedEvent(TUIEvent):
 class NotificationEvent(TUIEvent):
     """Event for displaying notifications to user."""
 
+    __slots__ = ("message", "severity")
+
     def __init__(self, message: str, severity: str = "information"):
         super().__init__(source="notification_manager")
         self.message = message
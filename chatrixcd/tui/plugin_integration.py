@@ -28,7 +28,7 @@ class PluginTUIExtension:
         """
         self.plugin = plugin
         self.logger = logging.getLogger(f"tui.plugin.{plugin.metadata.name}")
-        self._registered_screens = []
+        self._registered_screens = set()
 
     @abstractmethod
     async def register_tui_screens(self, registry: "ScreenRegistry", tui_app: "ChatrixTUI"):
@@ -65,7 +65,7 @@ class PluginTUIExtension:
         )
 
         if success:
-            self._registered_screens.append(name)
+            self._registered_screens.add(name)
             self.logger.info(f"Registered screen: {name}")
         else:
             self.logger.warning(f"Failed to register screen: {name}")
@@ -80,7 +80,7 @@ class PluginTUIExtension:
             registry.unregister(screen_name)
             self.logger.info(f"Unregistered screen: {screen_name}")
 
-        self._registered_screens = []
+        self._registered_screens.clear()
 
 
 class PluginScreenMixin:
@@ -98,13 +98,20 @@ class PluginScreenMixin:
         Returns:
             Plugin instance or None
         """
-        if not hasattr(self, "tui_app"):
+        plugin_manager = self._get_plugin_manager()
+        if plugin_manager is None:
             return None
 
-        if not hasattr(self.tui_app.bot, "plugin_manager"):
-            return None
+        return plugin_manager.loaded_plugins.get(plugin_name)
 
-        return self.tui_app.bot.plugin_manager.loaded_plugins.get(plugin_name)
+    def _get_plugin_manager(self):
+        """Resolve the bot's plugin manager once and cache it on the screen."""
+        plugin_manager = getattr(self, "_plugin_manager", None)
+        if plugin_manager is None:
+            bot = getattr(getattr(self, "tui_app", None), "bot", None)
+            plugin_manager = getattr(bot, "plugin_manager", None)
+            self._plugin_manager = plugin_manager
+        return plugin_manager
 
     def get_plugin_config(self, plugin_name: str):
         """Get plugin configuration.
@@ -5,7 +5,7 @@ from textual.containers import (
     Vertical,
     Horizontal,
 )
-from textual.widgets import Static, Button, Input, Label
+from textual.widgets import Static, Button, DataTable, Input, Label
 from textual.binding import Binding
 from textual.screen import ModalScreen
 
@@ -16,6 +16,9 @@ from chatrixcd.tui.plugin_integration import (
 )
 from chatrixcd.tui.widgets.common import DataGrid
 
+# Edit/Delete icons shown in each alias row (placeholder)
+ALIAS_ROW_ICONS = "✏️ 🗑️"
+
 
 class AliasInputModal(ModalScreen):
     """Modal for adding a new alias."""
@@ -86,10 +89,20 @@ class AliasesScreen(BaseScreen, PluginScreenMixin):
         Binding("d", "delete_alias", "Delete"),
     ]
 
+    # Button ID -> handler method name for on_button_pressed
+    _BUTTON_HANDLERS = {
+        "add-alias": "add_alias",
+        "delete-alias": "delete_selected_alias",
+        "refresh": "refresh_data",
+    }
+
     def __init__(self, *args, **kwargs):
         """Initialize aliases screen."""
         super().__init__(*args, **kwargs)
         self.selected_alias = None
+        # Aliases currently listed in the table, or None while it shows a
+        # placeholder row; lets refresh_data touch only rows that changed
+        self._shown_aliases = None
 
     def compose_content(self):
         """Compose aliases screen content."""
@@ -133,41 +146,54 @@ class AliasesScreen(BaseScreen, PluginScreenMixin):
         """Refresh aliases data."""
         try:
             table = self.query_one("#aliases-table", DataGrid)
-            table.clear()
 
-            # Get aliases plugin
+            # Get aliases plugin and its aliases
             plugin = self.get_plugin("aliases")
-            if not plugin:
-                table.add_row("Aliases plugin not loaded", "-", "-")
-                return
-
-            # Get aliases
-            aliases = plugin.list_aliases()
-
-            if not aliases:
-                table.add_row("[dim]No aliases configured[/dim]", "-", "-")
-                return
-
-            # Add each alias to table
-            for alias_name, command in aliases.items():
-                table.add_row(
-                    alias_name,
-                    command,
-                    "✏️ 🗑️",  # Edit/Delete icons (placeholder)
-                )
+            aliases = dict(plugin.list_aliases()) if plugin else {}
+            shown = self._shown_aliases
+
+            # Apply the changes with one repaint
+            with self.app.batch_update():
+                if shown and aliases:
+                    # Only touch rows whose alias was added, removed or changed
+                    for name in shown.keys() - aliases.keys():
+                        table.remove_row(name)
+                    for name, command in aliases.items():
+                        if name not in shown:
+                            table.add_row(name, command, ALIAS_ROW_ICONS, key=name)
+                        elif shown[name] != command:
+                            table.update_row(name, (name, command, ALIAS_ROW_ICONS))
+                else:
+                    table.clear()
+                    if not plugin:
+                        table.add_row("Aliases plugin not loaded", "-", "-")
+                    elif not aliases:
+                        table.add_row("[dim]No aliases configured[/dim]", "-", "-")
+                    else:
+                        # Rows are keyed by alias name
+                        table.add_rows(
+                            [(name, command, ALIAS_ROW_ICONS) for name, command in aliases.items()],
+                            keys=list(aliases),
+                        )
+            self._shown_aliases = aliases or None
 
         except Exception as e:
             self.logger.error(f"Error refreshing aliases: {e}")
             await self.show_error(f"Failed to load aliases: {e}")
 
+    def on_data_table_cell_highlighted(self, event: DataTable.CellHighlighted):
+        """Track the alias under the cursor.
+
+        Rows are keyed by alias name, so selection is read straight off the
+        event instead of scanning the table.
+        """
+        self.selected_alias = event.cell_key.row_key.value
+
     async def on_button_pressed(self, event: Button.Pressed):
         """Handle button presses."""
-        if event.button.id == "add-alias":
-            await self.add_alias()
-        elif event.button.id == "delete-alias":
-            await self.delete_selected_alias()
-        elif event.button.id == "refresh":
-            await self.refresh_data()
+        handler = self._BUTTON_HANDLERS.get(event.button.id)
+        if handler:
+            await getattr(self, handler)()
 
     async def add_alias(self):
         """Show modal to add new alias."""
@@ -212,8 +238,15 @@ class AliasesScreen(BaseScreen, PluginScreenMixin):
 
             if plugin.remove_alias(self.selected_alias):
                 await self.show_success(f"Alias '{self.selected_alias}' deleted")
+                # Drop just this row instead of reloading every alias
+                table = self.query_one("#aliases-table", DataGrid)
+                table.remove_row(self.selected_alias)
+                if self._shown_aliases:
+                    self._shown_aliases.pop(self.selected_alias, None)
                 self.selected_alias = None
-                await self.refresh_data()
+                if not table.row_count:
+                    table.add_row("[dim]No aliases configured[/dim]", "-", "-")
+                    self._shown_aliases = None
             else:
                 await self.show_error(f"Failed to delete alias '{self.selected_alias}'")
 
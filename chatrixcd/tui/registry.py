@@ -3,19 +3,21 @@
 Allows plugins to register their own screens dynamically.
 """
 
+import bisect
+import importlib
 import logging
-from typing import Dict, Type, Optional, Callable
+from typing import Dict, Type, Optional, Callable, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenRegistration:
     """Registration information for a screen."""
 
     name: str
-    screen_class: Type
+    screen_class: Union[Type, str]  # Class or "module:attr" import path
     title: str
     key_binding: Optional[str] = None
     priority: int = 50  # Lower priority = appears first in menu
@@ -24,6 +26,22 @@ class ScreenRegistration:
     plugin_name: Optional[str] = None
     condition: Optional[Callable[[], bool]] = None  # Function to check if screen should be shown
 
+    def resolve_screen_class(self) -> Type:
+        """Get the screen class, importing it on first use.
+
+        Returns:
+            The screen class
+        """
+        if isinstance(self.screen_class, str):
+            module_name, _, attr = self.screen_class.partition(":")
+            self.screen_class = getattr(importlib.import_module(module_name), attr)
+        return self.screen_class
+
+
+def _menu_order(registration: ScreenRegistration) -> tuple:
+    """Sort key for menu order: priority, then name."""
+    return (registration.priority, registration.name)
+
 
 class ScreenRegistry:
     """Registry for managing available TUI screens.
@@ -35,12 +53,19 @@ class ScreenRegistry:
     def __init__(self):
         """Initialize the screen registry."""
         self._screens: Dict[str, ScreenRegistration] = {}
-        self._key_bindings: Dict[str, str] = {}
+        # Key binding -> registration, so key lookups are a single dict hit
+        self._key_bindings: Dict[str, ScreenRegistration] = {}
+        # Registrations kept in menu order, overall and per category, so
+        # get_all() doesn't have to sort on every call
+        self._sorted: list[ScreenRegistration] = []
+        self._sorted_by_category: Dict[str, list[ScreenRegistration]] = {}
+        # Sorted category names, rebuilt only after a category comes or goes
+        self._sorted_categories: Optional[tuple[str, ...]] = None
 
     def register(
         self,
         name: str,
-        screen_class: Type,
+        screen_class: Union[Type, str],
         title: str,
         key_binding: Optional[str] = None,
         priority: int = 50,
@@ -53,7 +78,8 @@ class ScreenRegistry:
 
         Args:
             name: Unique identifier for the screen
-            screen_class: The screen class to instantiate
+            screen_class: The screen class to instantiate, or a "module:attr"
+                import path that is resolved when the screen is first opened
             title: Display title for the screen
             key_binding: Keyboard shortcut (e.g., 's' for status)
             priority: Display priority (lower = higher priority)
@@ -86,8 +112,13 @@ class ScreenRegistry:
         )
 
         self._screens[name] = registration
+        bisect.insort(self._sorted, registration, key=_menu_order)
+        if category not in self._sorted_by_category:
+            self._sorted_by_category[category] = []
+            self._sorted_categories = None
+        bisect.insort(self._sorted_by_category[category], registration, key=_menu_order)
         if key_binding:
-            self._key_bindings[key_binding] = name
+            self._key_bindings[key_binding] = registration
 
         logger.info(
             "Registered screen '%s' (key: %s, plugin: %s)",
@@ -106,14 +137,19 @@ class ScreenRegistry:
         Returns:
             True if unregistered, False if not found
         """
-        if name not in self._screens:
+        registration = self._screens.pop(name, None)
+        if registration is None:
             return False
 
-        registration = self._screens[name]
         if registration.key_binding:
             self._key_bindings.pop(registration.key_binding, None)
 
-        del self._screens[name]
+        self._remove_sorted(self._sorted, registration)
+        category_screens = self._sorted_by_category[registration.category]
+        self._remove_sorted(category_screens, registration)
+        if not category_screens:
+            del self._sorted_by_category[registration.category]
+            self._sorted_categories = None
         logger.info(f"Unregistered screen '{name}'")
         return True
 
@@ -137,10 +173,7 @@ class ScreenRegistry:
         Returns:
             ScreenRegistration if found, None otherwise
         """
-        screen_name = self._key_bindings.get(key)
-        if screen_name:
-            return self._screens.get(screen_name)
-        return None
+        return self._key_bindings.get(key)
 
     def get_all(self, category: Optional[str] = None) -> list[ScreenRegistration]:
         """Get all registered screens, optionally filtered by category.
@@ -151,18 +184,25 @@ class ScreenRegistry:
         Returns:
             List of ScreenRegistration objects, sorted by priority
         """
-        screens = list(self._screens.values())
-
         if category:
-            screens = [s for s in screens if s.category == category]
+            screens = self._sorted_by_category.get(category, [])
+        else:
+            screens = self._sorted
 
-        # Filter by condition
-        screens = [s for s in screens if not s.condition or s.condition()]
+        # Filter by condition; the index is already in priority, name order
+        return [s for s in screens if not s.condition or s.condition()]
 
-        # Sort by priority, then name
-        screens.sort(key=lambda s: (s.priority, s.name))
+    @staticmethod
+    def _remove_sorted(screens: list[ScreenRegistration], registration: ScreenRegistration):
+        """Remove a registration from a list kept in menu order.
 
-        return screens
+        Args:
+            screens: List sorted by priority, then name
+            registration: Registration to remove
+        """
+        index = bisect.bisect_left(screens, _menu_order(registration), key=_menu_order)
+        if index < len(screens) and screens[index] is registration:
+            del screens[index]
 
     def get_categories(self) -> list[str]:
         """Get list of all categories.
@@ -170,8 +210,9 @@ class ScreenRegistry:
         Returns:
             List of unique category names
         """
-        categories = {s.category for s in self._screens.values()}
-        return sorted(categories)
+        if self._sorted_categories is None:
+            self._sorted_categories = tuple(sorted(self._sorted_by_category))
+        return list(self._sorted_categories)
 
     def clear_plugin_screens(self, plugin_name: str) -> int:
         """Remove all screens registered by a plugin.
@@ -1,14 +1,44 @@
 """Configuration screen for viewing and editing config."""
 
-import copy
+import asyncio
 import json
+import os
+import stat
+import weakref
+from typing import Optional
 
 from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.widgets import Button, Static, TextArea
 
+from ...redactor import SENSITIVE_CONFIG_KEY_RE
 from .base import BaseScreen
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dump_config_json(config_dict) -> str:
+    """Pretty-print a config dict as JSON.
+
+    Uses orjson when it is installed, falling back to the stdlib encoder
+    for environments without it or values orjson cannot serialize.
+
+    Args:
+        config_dict: Configuration dictionary to encode
+
+    Returns:
+        JSON text indented by two spaces
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(config_dict, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(config_dict, indent=2)
+
 
 class ConfigScreen(BaseScreen):
     """Screen for viewing and editing configuration."""
@@ -53,6 +83,20 @@ class ConfigScreen(BaseScreen):
         Binding("s", "save_config", "Save"),
     ]
 
+    # Button ID -> handler method name for on_button_pressed
+    _BUTTON_HANDLERS = {
+        "edit-button": "toggle_edit_mode",
+        "save-button": "save_changes",
+        "discard-button": "discard_changes",
+    }
+
+    # Redacted JSON text per Config object, tagged with the config dict's
+    # id and Config.version it was rendered from. Re-opening the screen
+    # skips redaction and formatting until the config is reloaded or
+    # changed through Config.set(). Weak keys keep finished apps' configs
+    # from being pinned.
+    _render_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
     def __init__(self, *args, **kwargs):
         """Initialize config screen."""
         super().__init__(*args, **kwargs)
@@ -102,51 +146,86 @@ class ConfigScreen(BaseScreen):
     async def refresh_data(self):
         """Refresh configuration data."""
         try:
-            # Get config dict
-            config_dict = copy.deepcopy(self.tui_app.config.config)
-
-            # Redact sensitive fields manually (same as main.py)
-            sensitive_fields = [
-                "password",
-                "access_token",
-                "api_token",
-                "client_secret",
-                "oidc_client_secret",
-            ]
-
-            def redact_sensitive(obj, path=""):
-                """Recursively redact sensitive fields."""
-                if isinstance(obj, dict):
-                    for key, value in obj.items():
-                        if key in sensitive_fields and value:
-                            obj[key] = "***REDACTED***"
-                        else:
-                            redact_sensitive(value, f"{path}.{key}" if path else key)
-                elif isinstance(obj, list):
-                    for item in obj:
-                        redact_sensitive(item, path)
-
-            redact_sensitive(config_dict)
-
-            # Format as JSON
-            config_text = json.dumps(config_dict, indent=2)
-
             # Update text area
             text_area = self.query_one("#config-content", TextArea)
-            await text_area.load_text(config_text)
+            config_text = self._cached_config_text()
+            if config_text is None:
+                # Copying and encoding a large config is CPU-bound, so keep
+                # it off the event loop
+                config_text = await asyncio.to_thread(self._render_config_text)
+            # Back-to-back refreshes of an unchanged config leave the text
+            # area alone instead of reloading (and re-highlighting) it
+            if text_area.text != config_text:
+                await text_area.load_text(config_text)
 
         except Exception as e:
             self.logger.error(f"Error loading config: {e}")
             await self.show_error(f"Failed to load configuration: {e}")
 
+    def _config_token(self) -> tuple:
+        """Identify the current state of the config being shown.
+
+        Returns:
+            The config dict's id and the Config version
+        """
+        config = self.tui_app.config
+        return (id(config.config), config.version)
+
+    def _cached_config_text(self) -> Optional[str]:
+        """Get the rendered text if it is still current.
+
+        Returns:
+            Cached redacted JSON, or None if the config changed since
+        """
+        cached = ConfigScreen._render_cache.get(self.tui_app.config)
+        if cached is not None and cached[0] == self._config_token():
+            return cached[1]
+        return None
+
+    def _render_config_text(self) -> str:
+        """Get the redacted JSON text for the current config.
+
+        The text is only rebuilt when the config is reloaded or its
+        version changes.
+
+        Returns:
+            Pretty-printed JSON with sensitive values redacted
+        """
+        cached = self._cached_config_text()
+        if cached is not None:
+            return cached
+
+        token = self._config_token()
+        source = self.tui_app.config.config
+
+        # Copy containers while walking so the redaction needs a single pass
+        # instead of a full deepcopy first; leaf values are shared
+        config_dict = dict(source)
+        stack = [config_dict]
+        while stack:
+            obj = stack.pop()
+            is_dict = isinstance(obj, dict)
+            for key, value in obj.items() if is_dict else enumerate(obj):
+                if is_dict and value and SENSITIVE_CONFIG_KEY_RE.search(key):
+                    obj[key] = "***REDACTED***"
+                elif isinstance(value, dict):
+                    obj[key] = copied = dict(value)
+                    stack.append(copied)
+                elif isinstance(value, list):
+                    obj[key] = copied = list(value)
+                    stack.append(copied)
+
+        # Format as JSON
+        config_text = _dump_config_json(config_dict)
+
+        ConfigScreen._render_cache[self.tui_app.config] = (token, config_text)
+        return config_text
+
     async def on_button_pressed(self, event: Button.Pressed):
         """Handle button presses."""
-        if event.button.id == "edit-button":
-            await self.toggle_edit_mode()
-        elif event.button.id == "save-button":
-            await self.save_changes()
-        elif event.button.id == "discard-button":
-            await self.discard_changes()
+        handler = self._BUTTON_HANDLERS.get(event.button.id)
+        if handler:
+            await getattr(self, handler)()
 
     async def toggle_edit_mode(self):
         """Toggle between view and edit mode."""
@@ -157,17 +236,16 @@ class ConfigScreen(BaseScreen):
 
         self.edit_mode = not self.edit_mode
 
+        # Flip the widgets in one repaint rather than one per property
+        with self.app.batch_update():
+            text_area.read_only = not self.edit_mode
+            edit_button.label = "View Mode" if self.edit_mode else "Edit Mode"
+            save_button.disabled = not self.edit_mode
+            discard_button.disabled = not self.edit_mode
+
         if self.edit_mode:
-            text_area.read_only = False
-            edit_button.label = "View Mode"
-            save_button.disabled = False
-            discard_button.disabled = False
             await self.show_notification("Edit mode enabled", "information")
         else:
-            text_area.read_only = True
-            edit_button.label = "Edit Mode"
-            save_button.disabled = True
-            discard_button.disabled = True
             await self.show_notification("View mode enabled", "information")
 
     async def save_changes(self):
@@ -176,25 +254,24 @@ class ConfigScreen(BaseScreen):
             text_area = self.query_one("#config-content", TextArea)
             config_text = text_area.text
 
-            # Parse JSON
-            try:
-                new_config = json.loads(config_text)
-            except json.JSONDecodeError as e:
-                await self.show_error(f"Invalid JSON: {e}")
-                return
-
             # Validate and save
             # Note: This is a simplified version. In production, you'd want
             # more sophisticated validation and merging logic
 
             config_file = getattr(self.tui_app.config, "config_file", "config.json")
 
-            with open(config_file, "w") as f:
-                json.dump(new_config, f, indent=2)
+            # Parsing and writing a large config is slow, so keep it off the
+            # event loop
+            try:
+                await asyncio.to_thread(self._write_config, config_text, config_file)
+            except json.JSONDecodeError as e:
+                await self.show_error(f"Invalid JSON: {e}")
+                return
 
             await self.show_success("Configuration saved successfully")
 
-            # Reload config
+            # Reload on the event loop: load_config() resets to defaults before
+            # merging the file, and the bot must never see that midway state
             self.tui_app.config.load_config()
             await self.refresh_data()
 
@@ -205,9 +282,56 @@ class ConfigScreen(BaseScreen):
             self.logger.error(f"Error saving config: {e}")
             await self.show_error(f"Failed to save configuration: {e}")
 
+    def _write_config(self, config_text: str, config_file: str):
+        """Parse edited config text and write it to disk.
+
+        Runs in a worker thread.
+
+        Args:
+            config_text: Edited JSON text
+            config_file: Path of the config file to replace
+
+        Raises:
+            json.JSONDecodeError: If the text is not valid JSON
+        """
+        new_config = json.loads(config_text)
+
+        # Serialize up front and write in one go to a temp file that
+        # replaces the config atomically, so a crash can't truncate it
+        payload = json.dumps(new_config, indent=2).encode("utf-8")
+        tmp_file = f"{config_file}.tmp"
+
+        # The config holds passwords and tokens, so the temp file must not
+        # be readable by anyone the original file isn't (umask may be 0)
+        try:
+            mode = stat.S_IMODE(os.stat(config_file).st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "wb") as f:
+                os.fchmod(f.fileno(), mode)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+
     async def discard_changes(self):
         """Discard configuration changes."""
-        await self.refresh_data()
+        # Only reload the text area when the user actually edited it. Compare
+        # against the cached render; if the config changed since, let
+        # refresh_data() re-render it off the event loop.
+        text_area = self.query_one("#config-content", TextArea)
+        cached = self._cached_config_text()
+        if cached is None or text_area.text != cached:
+            await self.refresh_data()
         await self.toggle_edit_mode()
         await self.show_notification("Changes discarded", "information")
 
@@ -1,6 +1,10 @@
 """Logs screen showing bot logs."""
 
+import asyncio
 import os
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from textual.binding import Binding
 from textual.containers import Container
@@ -8,6 +12,12 @@ from textual.widgets import Static, TextArea
 
 from .base import BaseScreen
 
+# Bytes read per step when scanning the log file backwards
+LOG_BLOCK_SIZE = 64 * 1024
+
+# Appended data beyond this is rescanned from the end rather than read whole
+LOG_APPEND_LIMIT = 16 * LOG_BLOCK_SIZE
+
 
 class LogsScreen(BaseScreen):
     """Screen for viewing bot logs."""
@@ -45,6 +55,17 @@ class LogsScreen(BaseScreen):
         Binding("r", "refresh", "Refresh"),
     ]
 
+    # Tail of the log kept between refreshes and instances so only lines
+    # appended since the last read are loaded. _tail_source identifies the
+    # file (path, inode, line limit); _tail_offset is where the next
+    # unread line starts. Loads run in worker threads and may overlap
+    # (mount plus a manual refresh), so _tail_lock guards the whole
+    # read-and-update.
+    _tail_source: Optional[Tuple[str, int, int]] = None
+    _tail_offset = 0
+    _tail_lines: Deque[bytes] = deque()
+    _tail_lock = threading.Lock()
+
     def compose_content(self):
         """Compose logs screen content."""
         with Container(classes="logs-container"):
@@ -65,7 +86,8 @@ class LogsScreen(BaseScreen):
     async def refresh_data(self):
         """Refresh log content."""
         try:
-            log_content = self._load_logs()
+            # File I/O runs in a worker thread so the UI stays responsive
+            log_content = await asyncio.to_thread(self._load_logs)
             text_area = self.query_one("#log-content", TextArea)
             await text_area.load_text(log_content)
 
@@ -87,23 +109,114 @@ class LogsScreen(BaseScreen):
             bot_config = self.tui_app.config.get_bot_config()
             log_file = bot_config.get("log_file", "chatrixcd.log")
 
-            if not os.path.exists(log_file):
+            # Read last N lines; a missing file surfaces from open() itself
+            # rather than a separate exists() check
+            try:
+                with open(log_file, "rb") as f:
+                    lines = self._read_new_lines(f, log_file, max_lines)
+            except FileNotFoundError:
                 return f"[dim]Log file not found: {log_file}[/dim]"
 
-            # Read last N lines
-            with open(log_file, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
+            # Take last max_lines in reverse so newest is first
+            recent_lines = lines[: -max_lines - 1 : -1]
 
-            # Get last max_lines, reverse so newest is first
-            recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
-            recent_lines.reverse()
-
-            return "".join(recent_lines)
+            return b"".join(recent_lines).decode("utf-8", errors="replace")
 
         except Exception as e:
             self.logger.error(f"Error loading log file: {e}")
             return f"[red]Error loading logs: {e}[/red]"
 
+    @classmethod
+    def _read_new_lines(cls, f, log_file: str, max_lines: int) -> List[bytes]:
+        """Bring the cached log tail up to date and return it.
+
+        Only bytes appended since the previous read are loaded. The tail is
+        rebuilt from the end of the file on first use, when the file was
+        rotated or truncated, or when too much was appended to be worth
+        reading in full.
+
+        Args:
+            f: Log file opened in binary mode
+            log_file: Path the file was opened from
+            max_lines: Number of trailing lines to keep
+
+        Returns:
+            List of raw lines (with line endings), oldest first
+        """
+        with cls._tail_lock:
+            st = os.fstat(f.fileno())
+            source = (log_file, st.st_ino, max_lines)
+
+            if (
+                source != cls._tail_source
+                or st.st_size < cls._tail_offset
+                or st.st_size - cls._tail_offset > LOG_APPEND_LIMIT
+            ):
+                lines = cls._read_tail(f, max_lines, st.st_size)
+                cls._tail_source = source
+                cls._tail_lines = deque(maxlen=max_lines)
+            else:
+                f.seek(cls._tail_offset)
+                lines = cls._split_lines(f.read(st.st_size - cls._tail_offset))
+
+            # A line still being written is shown but re-read next time
+            partial = lines.pop() if lines and not lines[-1].endswith(b"\n") else b""
+            cls._tail_lines.extend(lines)
+            cls._tail_offset = st.st_size - len(partial)
+
+            return [*cls._tail_lines, partial] if partial else list(cls._tail_lines)
+
+    @staticmethod
+    def _read_tail(f, max_lines: int, end: int) -> List[bytes]:
+        """Read the lines at the end of a binary file.
+
+        Reads fixed-size blocks backwards from the end until enough newlines
+        have been seen, so only the tail of a large log is loaded.
+
+        Args:
+            f: File opened in binary mode
+            max_lines: Minimum number of trailing lines to return
+            end: Offset to read back from (the file size)
+
+        Returns:
+            List of raw lines (with line endings), oldest first
+        """
+        pos = end
+        blocks = []
+        newlines = 0
+        # One extra newline guarantees the first (possibly partial) line
+        # is not among the last max_lines
+        while pos > 0 and newlines <= max_lines:
+            read_size = min(LOG_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+        blocks.reverse()
+        return LogsScreen._split_lines(b"".join(blocks))
+
+    @staticmethod
+    def _split_lines(data: bytes) -> List[bytes]:
+        """Split raw log data into lines.
+
+        Only newlines end a line; a bare carriage return does not, and a
+        CRLF ending becomes a plain newline.
+        A trailing piece without a newline is kept as the last element.
+
+        Args:
+            data: Raw bytes read from the log file
+
+        Returns:
+            List of lines ending in b"\\n", plus any unterminated tail
+        """
+        *complete, tail = data.split(b"\n")
+        lines = [line[:-1] + b"\n" if line.endswith(b"\r") else line + b"\n" for line in complete]
+        if tail:
+            lines.append(tail)
+        return lines
+
     def action_refresh(self):
         """Manually refresh logs."""
         self.app.call_later(self.refresh_data)
@@ -102,6 +102,12 @@ class MainMenuScreen(BaseScreen):
         Binding("r", "refresh", "Refresh"),
     ]
 
+    def __init__(self, *args, **kwargs):
+        """Initialize main menu screen."""
+        super().__init__(*args, **kwargs)
+        # Menu button ID -> registered screen name, filled by populate_menu
+        self._menu_targets = {}
+
     def compose_content(self):
         """Compose main menu content."""
         with Container(classes="main-container"):
@@ -160,6 +166,7 @@ class MainMenuScreen(BaseScreen):
 
         # Clear existing buttons
         await menu_container.remove_children()
+        self._menu_targets = {}
 
         # Get all registered screens from registry
         registry = self.tui_app.screen_registry
@@ -182,6 +189,7 @@ class MainMenuScreen(BaseScreen):
                         id=f"menu-{screen_reg.name}",
                         classes="menu-button",
                     )
+                    self._menu_targets[button.id] = screen_reg.name
                     await menu_container.mount(button)
 
     async def navigate_to_screen(self, screen_name: str):
@@ -199,7 +207,7 @@ class MainMenuScreen(BaseScreen):
 
         try:
             # Instantiate screen
-            screen = registration.screen_class(self.tui_app)
+            screen = registration.resolve_screen_class()(self.tui_app)
             self.app.push_screen(screen)
         except Exception as e:
             self.logger.error(f"Failed to load screen '{screen_name}': {e}")
@@ -207,48 +215,49 @@ class MainMenuScreen(BaseScreen):
 
     async def on_button_pressed(self, event: Button.Pressed):
         """Handle button presses."""
-        if event.button.id and event.button.id.startswith("menu-"):
-            # Extract screen name from button ID
-            screen_name = event.button.id[5:]  # Remove "menu-" prefix
+        screen_name = self._menu_targets.get(event.button.id)
+        if screen_name:
             await self.navigate_to_screen(screen_name)
 
     async def refresh_data(self):
         """Refresh status and metrics."""
         try:
-            # Update status indicators
-            matrix_status = self.query_one(StatusIndicator)
-            if self.tui_app.bot and self.tui_app.bot.client:
-                if self.tui_app.bot.client.logged_in:
-                    matrix_status.status = "Connected"
+            # Apply every status and metric change in a single repaint
+            with self.app.batch_update():
+                # Update status indicators
+                matrix_status = self.query_one(StatusIndicator)
+                if self.tui_app.bot and self.tui_app.bot.client:
+                    if self.tui_app.bot.client.logged_in:
+                        matrix_status.status = "Connected"
+                    else:
+                        matrix_status.status = "Disconnected"
                 else:
-                    matrix_status.status = "Disconnected"
-            else:
-                matrix_status.status = "Unknown"
-
-            # Update metrics
-            if hasattr(self.tui_app.bot, "metrics"):
-                metrics = self.tui_app.bot.metrics
-
-                uptime_metric = self.query_one("#uptime-metric", MetricDisplay)
-                uptime_metric.value = self._format_uptime(metrics.get("uptime", 0))
-
-                messages_metric = self.query_one("#messages-metric", MetricDisplay)
-                messages_metric.value = metrics.get("messages_sent", 0)
-
-                tasks_metric = self.query_one("#tasks-metric", MetricDisplay)
-                active_tasks = getattr(self.tui_app.bot.command_handler, "active_tasks", {})
-                tasks_metric.value = len(active_tasks)
-
-                # Update ActiveTasksWidget if present
-                try:
-                    active_widget = self.query_one("#active_tasks")
-                    if hasattr(active_widget, "update_tasks"):
-                        active_widget.update_tasks(active_tasks)
-                except Exception:
-                    pass
-
-                errors_metric = self.query_one("#errors-metric", MetricDisplay)
-                errors_metric.value = metrics.get("errors", 0)
+                    matrix_status.status = "Unknown"
+
+                # Update metrics
+                if hasattr(self.tui_app.bot, "metrics"):
+                    metrics = self.tui_app.bot.metrics
+
+                    uptime_metric = self.query_one("#uptime-metric", MetricDisplay)
+                    uptime_metric.value = self._format_uptime(metrics.get("uptime", 0))
+
+                    messages_metric = self.query_one("#messages-metric", MetricDisplay)
+                    messages_metric.value = metrics.get("messages_sent", 0)
+
+                    tasks_metric = self.query_one("#tasks-metric", MetricDisplay)
+                    active_tasks = getattr(self.tui_app.bot.command_handler, "active_tasks", {})
+                    tasks_metric.value = len(active_tasks)
+
+                    # Update ActiveTasksWidget if present
+                    try:
+                        active_widget = self.query_one("#active_tasks")
+                        if hasattr(active_widget, "update_tasks"):
+                            active_widget.update_tasks(active_tasks)
+                    except Exception:
+                        pass
+
+                    errors_metric = self.query_one("#errors-metric", MetricDisplay)
+                    errors_metric.value = metrics.get("errors", 0)
 
         except Exception as e:
             self.logger.error(f"Error refreshing data: {e}")
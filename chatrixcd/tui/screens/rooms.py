@@ -36,8 +36,8 @@ class RoomsScreen(BaseScreen):
     }
     """
 
-    def __init__(self, rooms=None, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, tui_app=None, *args, rooms=None, **kwargs):
+        super().__init__(tui_app, *args, **kwargs)
         # Allow direct instantiation in tests with a rooms list
         self.rooms = rooms
 
@@ -63,24 +63,31 @@ class RoomsScreen(BaseScreen):
         """Refresh rooms data."""
         try:
             table = self.query_one("#rooms-table", DataTable)
-            table.clear()
 
             if not self.tui_app.bot or not self.tui_app.bot.client:
+                table.clear()
                 return
 
             client = self.tui_app.bot.client
 
             if not hasattr(client, "rooms") or not client.rooms:
-                table.add_row("No rooms", "-", "-", "-")
-                return
-
-            # Add each room to table
-            for room_id, room in client.rooms.items():
-                room_name = room.display_name or room.name or "Unnamed Room"
-                member_count = len(room.users)
-                encrypted = "Yes" if room.encrypted else "No"
-
-                table.add_row(room_name, room_id, str(member_count), encrypted)
+                rows = [("No rooms", "-", "-", "-")]
+            else:
+                # Build every row up front, then swap the table contents in
+                # a single repaint
+                rows = [
+                    (
+                        room.display_name or room.name or "Unnamed Room",
+                        room_id,
+                        str(len(room.users)),
+                        "Yes" if room.encrypted else "No",
+                    )
+                    for room_id, room in client.rooms.items()
+                ]
+
+            with self.app.batch_update():
+                table.clear()
+                table.add_rows(rows)
 
         except Exception as e:
             self.logger.error(f"Error refreshing rooms: {e}")
@@ -105,6 +105,22 @@ class StatusScreen(BaseScreen):
         await self.refresh_data()
         self.set_interval(3.0, self.refresh_data)
 
+    def _get_verification_manager(self):
+        """Get a verification manager without rebuilding it on every refresh.
+
+        Prefers the bot's own manager; otherwise one is imported and built
+        on first use, keeping the crypto stack out of TUI startup.
+        """
+        manager = getattr(self.tui_app.bot, "verification_manager", None)
+        if manager is None:
+            manager = getattr(self, "_verification_manager", None)
+            if manager is None:
+                from ...verification import DeviceVerificationManager
+
+                manager = DeviceVerificationManager(self.tui_app.bot.client)
+                self._verification_manager = manager
+        return manager
+
     async def refresh_data(self):
         """Refresh status and metrics data."""
         try:
@@ -132,9 +148,7 @@ class StatusScreen(BaseScreen):
                 if self.tui_app.bot.client.olm:
                     # Check if we have any verified devices
                     try:
-                        from ...verification import DeviceVerificationManager
-
-                        verification_manager = DeviceVerificationManager(self.tui_app.bot.client)
+                        verification_manager = self._get_verification_manager()
                         verified_devices = await verification_manager.get_verified_devices()
                         if verified_devices:
                             encryption_status.status = f"E2E ({len(verified_devices)} verified)"
@@ -151,21 +165,26 @@ class StatusScreen(BaseScreen):
             if hasattr(self.tui_app.bot, "metrics"):
                 metrics = self.tui_app.bot.metrics
 
-                self.query_one("#uptime", MetricDisplay).value = self._format_uptime(
-                    metrics.get("uptime", 0)
-                )
-                self.query_one("#messages_sent", MetricDisplay).value = metrics.get(
-                    "messages_sent", 0
-                )
-                self.query_one("#requests_received", MetricDisplay).value = metrics.get(
-                    "requests_received", 0
-                )
-                self.query_one("#errors", MetricDisplay).value = metrics.get("errors", 0)
-                self.query_one("#emojis_used", MetricDisplay).value = metrics.get("emojis_used", 0)
+                # Coalesce the metric repaints into a single screen update
+                with self.app.batch_update():
+                    self.query_one("#uptime", MetricDisplay).value = self._format_uptime(
+                        metrics.get("uptime", 0)
+                    )
+                    self.query_one("#messages_sent", MetricDisplay).value = metrics.get(
+                        "messages_sent", 0
+                    )
+                    self.query_one("#requests_received", MetricDisplay).value = metrics.get(
+                        "requests_received", 0
+                    )
+                    self.query_one("#errors", MetricDisplay).value = metrics.get("errors", 0)
+                    self.query_one("#emojis_used", MetricDisplay).value = metrics.get(
+                        "emojis_used", 0
+                    )
 
             # Update active tasks
-            if hasattr(self.tui_app.bot, "command_handler"):
-                active_tasks = getattr(self.tui_app.bot.command_handler, "active_tasks", {})
+            command_handler = getattr(self.tui_app.bot, "command_handler", None)
+            if command_handler is not None:
+                active_tasks = getattr(command_handler, "active_tasks", {})
                 self.query_one("#active_tasks", MetricDisplay).value = len(active_tasks)
 
                 # Format active tasks list
@@ -201,8 +220,8 @@ class StatusScreen(BaseScreen):
 
                 # Update plugins list
                 plugins_widget = self.query_one("#plugins-list", Static)
-                if hasattr(self.tui_app.bot, "plugin_manager"):
-                    plugin_manager = self.tui_app.bot.plugin_manager
+                plugin_manager = getattr(self.tui_app.bot, "plugin_manager", None)
+                if plugin_manager is not None:
                     plugins_status = plugin_manager.get_all_plugins_status()
 
                     if plugins_status:
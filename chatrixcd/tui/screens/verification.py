@@ -103,6 +103,15 @@ class VerificationScreen(BaseScreen):
         Binding("escape", "back", "Back to Menu"),
     ]
 
+    # Action buttons as (label, button id, variant, handler method name)
+    ACTION_BUTTONS = (
+        ("Start Verification", "start-verification-btn", "primary", "_start_verification"),
+        ("Accept Pending", "accept-pending-btn", "success", "_accept_pending_verification"),
+        ("Reject Pending", "reject-pending-btn", "error", "_reject_pending_verification"),
+        ("Cross-Verify Bots", "cross-verify-btn", "warning", "_cross_verify_bots"),
+    )
+    _ACTION_HANDLERS = {button_id: handler for _, button_id, _, handler in ACTION_BUTTONS}
+
     def __init__(self, *args, **kwargs):
         """Initialize verification screen."""
         super().__init__(*args, **kwargs)
@@ -138,14 +147,8 @@ class VerificationScreen(BaseScreen):
                 yield Static("[bold]Actions[/bold]", classes="section-header")
 
                 with Horizontal(classes="verification-buttons"):
-                    yield Button(
-                        "Start Verification",
-                        id="start-verification-btn",
-                        variant="primary",
-                    )
-                    yield Button("Accept Pending", id="accept-pending-btn", variant="success")
-                    yield Button("Reject Pending", id="reject-pending-btn", variant="error")
-                    yield Button("Cross-Verify Bots", id="cross-verify-btn", variant="warning")
+                    for label, button_id, variant, _ in self.ACTION_BUTTONS:
+                        yield Button(label, id=button_id, variant=variant)
 
                 # Emoji verification display (shown during active verification)
                 with Vertical(id="emoji-container", classes="emoji-display"):
@@ -157,11 +160,15 @@ class VerificationScreen(BaseScreen):
 
     async def on_screen_mount(self):
         """Initialize verification screen."""
-        # Initialize verification manager
+        # Use the bot's verification manager; each manager keeps a sync
+        # callback on the client, so one is only built when the bot has none
         if self.tui_app.bot and self.tui_app.bot.client:
-            from ...verification import DeviceVerificationManager
+            manager = getattr(self.tui_app.bot, "verification_manager", None)
+            if manager is None:
+                from ...verification import DeviceVerificationManager
 
-            self.verification_manager = DeviceVerificationManager(self.tui_app.bot.client)
+                manager = DeviceVerificationManager(self.tui_app.bot.client)
+            self.verification_manager = manager
 
         await self.refresh_data()
         self.set_interval(5.0, self.refresh_data)
@@ -176,18 +183,16 @@ class VerificationScreen(BaseScreen):
             return
 
         try:
+            # Walk the device store once for both device tables
+            devices = await self.verification_manager.get_devices_by_status()
+
             # Update verified devices table
             verified_table = self.query_one("#verified-devices-table", DataTable)
-            await self._populate_devices_table(
-                verified_table, await self.verification_manager.get_verified_devices()
-            )
+            await self._populate_devices_table(verified_table, devices["verified"])
 
             # Update unverified devices table
             unverified_table = self.query_one("#unverified-devices-table", DataTable)
-            await self._populate_devices_table(
-                unverified_table,
-                await self.verification_manager.get_unverified_devices(),
-            )
+            await self._populate_devices_table(unverified_table, devices["unverified"])
 
             # Update pending verifications table
             pending_table = self.query_one("#pending-table", DataTable)
@@ -253,14 +258,9 @@ class VerificationScreen(BaseScreen):
         """Handle button presses."""
         button_id = event.button.id
 
-        if button_id == "start-verification-btn":
-            await self._start_verification()
-        elif button_id == "accept-pending-btn":
-            await self._accept_pending_verification()
-        elif button_id == "reject-pending-btn":
-            await self._reject_pending_verification()
-        elif button_id == "cross-verify-btn":
-            await self._cross_verify_bots()
+        handler = self._ACTION_HANDLERS.get(button_id)
+        if handler:
+            await getattr(self, handler)()
         elif button_id == "confirm-match-btn":
             await self._confirm_verification_match(True)
         elif button_id == "confirm-no-match-btn":
@@ -350,12 +350,11 @@ class VerificationScreen(BaseScreen):
         try:
             # Get current room members (this is a simplified approach)
             # In a real implementation, you'd get this from the current room context
-            room_members = []
+            room_members = {}
             if self.tui_app.bot and self.tui_app.bot.client and self.tui_app.bot.client.rooms:
                 # Get members from the first room (simplified)
-                for room in self.tui_app.bot.client.rooms.values():
-                    room_members = list(room.users.keys())
-                    break
+                room = next(iter(self.tui_app.bot.client.rooms.values()))
+                room_members = room.users
 
             started_count = await self.verification_manager.cross_verify_with_bots(room_members)
 
@@ -386,7 +385,7 @@ class VerificationScreen(BaseScreen):
         )
 
         emoji_display = self.query_one("#emoji-list-display", Static)
-        emoji_text = "\n".join([f"{emoji} {name}" for emoji, name in emoji_list])
+        emoji_text = "\n".join(f"{emoji} {name}" for emoji, name in emoji_list)
         emoji_display.update(emoji_text)
 
         # Create a future to wait for user response
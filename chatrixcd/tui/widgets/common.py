@@ -1,6 +1,6 @@
 """Common reusable widgets for TUI."""
 
-from typing import Optional, Callable
+from typing import Callable, Iterable, Optional
 from textual.widgets import Static, Button, DataTable, Input, Label
 from textual.containers import Container, Vertical, Horizontal
 from textual.reactive import reactive
@@ -62,6 +62,11 @@ class MetricDisplay(BaseWidget):
     value: reactive[str | int] = reactive(0)
     icon: reactive[str] = reactive("")
 
+    # Rendered "icon label:" markup and the (icon, label) it was built from;
+    # only the value changes on most refreshes
+    _prefix_key: tuple = ()
+    _prefix: str = ""
+
     def __init__(
         self,
         label: str = "Metric",
@@ -84,8 +89,12 @@ class MetricDisplay(BaseWidget):
 
     def render(self) -> str:
         """Render the metric display."""
-        icon_str = f"{self.icon} " if self.icon else ""
-        return f"[bold]{icon_str}{self.label}:[/bold] {self.value}"
+        key = (self.icon, self.label)
+        if key != self._prefix_key:
+            icon_str = f"{self.icon} " if self.icon else ""
+            self._prefix = f"[bold]{icon_str}{self.label}:[/bold] "
+            self._prefix_key = key
+        return f"{self._prefix}{self.value}"
 
 
 class ActionButton(Button):
@@ -252,12 +261,62 @@ class DataGrid(Container):
         for column in self.columns:
             table.add_column(column, key=column.lower().replace(" ", "_"))
 
-    def add_row(self, *cells):
-        """Add a row to the table."""
+    def add_row(self, *cells, key: Optional[str] = None):
+        """Add a row to the table.
+
+        Args:
+            key: Optional row key, reported back in highlight events
+        """
         table = self.query_one(DataTable)
-        table.add_row(*cells)
+        table.add_row(*cells, key=key)
         self._data.append(cells)
 
+    def add_rows(self, rows: Iterable[tuple], keys: Optional[Iterable[str]] = None):
+        """Add several rows with a single table lookup.
+
+        Args:
+            rows: Cell tuples, one per row
+            keys: Optional row keys, one per row, reported back in highlight
+                events
+        """
+        table = self.query_one(DataTable)
+        rows = [tuple(row) for row in rows]
+        if keys is None:
+            table.add_rows(rows)
+        else:
+            for cells, key in zip(rows, keys):
+                table.add_row(*cells, key=key)
+        self._data.extend(rows)
+
+    def update_row(self, key: str, cells: tuple):
+        """Replace the cells of a single keyed row in place.
+
+        Args:
+            key: Row key given to add_row
+            cells: New cell values, one per column
+        """
+        table = self.query_one(DataTable)
+        old_cells = tuple(table.get_row(key))
+        for column, value in zip(self.columns, cells):
+            table.update_cell(key, column.lower().replace(" ", "_"), value)
+        self._data[self._data.index(old_cells)] = tuple(cells)
+
+    def remove_row(self, key: str):
+        """Remove a single keyed row without rebuilding the table.
+
+        Args:
+            key: Row key given to add_row
+        """
+        table = self.query_one(DataTable)
+        cells = tuple(table.get_row(key))
+        table.remove_row(key)
+        self._data.remove(cells)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows currently in the table."""
+        return len(self._data)
+
     def clear(self):
         """Clear all rows."""
         table = self.query_one(DataTable)
@@ -267,8 +326,7 @@ class DataGrid(Container):
     def refresh_data(self, data: list[tuple]):
         """Refresh table with new data."""
         self.clear()
-        for row in data:
-            self.add_row(*row)
+        self.add_rows(data)
 
 
 class NotificationDisplay(Static):
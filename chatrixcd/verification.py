@@ -7,8 +7,9 @@ It handles SAS (emoji) verification following the Matrix specification for devic
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Callable, Tuple
-from nio import AsyncClient, ToDeviceError
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Callable, Tuple
+from nio import AsyncClient, SyncResponse, ToDeviceError
 
 # Try to import Sas for device verification
 # These may not be available in all versions of matrix-nio
@@ -43,6 +44,13 @@ class DeviceVerificationManager:
         self.client = client
         # Track cancelled/failed verifications to show manual verification message
         self.cancelled_verifications: Dict[str, Dict[str, str]] = {}
+        # Key exchange waiters by transaction ID, woken from the sync callback.
+        # The callback is registered once for the manager's lifetime and does
+        # nothing while no waits are pending.
+        self._key_waiters: Dict[str, Tuple[Any, asyncio.Event]] = {}
+        self.client.add_response_callback(self._on_sync_response, SyncResponse)
+        # Pending verification details by transaction ID, reused across polls
+        self._pending_info: Dict[str, Dict[str, Any]] = {}
 
     async def get_verified_devices(self) -> List[Dict[str, Any]]:
         """Get list of verified devices.
@@ -59,23 +67,21 @@ class DeviceVerificationManager:
 
         try:
             if hasattr(self.client, "device_store") and self.client.device_store:
-                for user_id in self.client.device_store.users:
-                    user_devices = self.client.device_store[user_id]
-                    for device_id, device in user_devices.items():
-                        # Skip our own device
-                        if user_id == self.client.user_id and device_id == self.client.device_id:
-                            continue
-                        # Only include verified devices
-                        if getattr(device, "verified", False):
-                            verified_devices.append(
-                                {
-                                    "user_id": user_id,
-                                    "device_id": device_id,
-                                    "device_name": getattr(device, "display_name", "Unknown"),
-                                    "trust_state": getattr(device, "trust_state", None),
-                                    "device": device,
-                                }
-                            )
+                store = self.client.device_store
+                own = (self.client.user_id, self.client.device_id)
+                verified_devices = [
+                    {
+                        "user_id": user_id,
+                        "device_id": device_id,
+                        "device_name": getattr(device, "display_name", "Unknown"),
+                        "trust_state": getattr(device, "trust_state", None),
+                        "device": device,
+                    }
+                    for user_id in store.users
+                    for device_id, device in store[user_id].items()
+                    # Skip our own device, only include verified devices
+                    if (user_id, device_id) != own and getattr(device, "verified", False)
+                ]
         except Exception as e:
             logger.error(f"Error getting verified devices: {e}")
 
@@ -178,6 +184,41 @@ class DeviceVerificationManager:
 
         unverified_devices = []
 
+        try:
+            if hasattr(self.client, "device_store") and self.client.device_store:
+                store = self.client.device_store
+                own = (self.client.user_id, self.client.device_id)
+                unverified_devices = [
+                    {
+                        "user_id": user_id,
+                        "device_id": device_id,
+                        "device_name": getattr(device, "display_name", "Unknown"),
+                        "device": device,
+                    }
+                    for user_id in store.users
+                    for device_id, device in store[user_id].items()
+                    # Skip our own device, only include unverified devices
+                    if (user_id, device_id) != own and not getattr(device, "verified", False)
+                ]
+        except Exception as e:
+            logger.error(f"Error getting unverified devices: {e}")
+
+        return unverified_devices
+
+    async def get_devices_by_status(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get known devices grouped by verification status in a single pass.
+
+        Returns:
+            Dictionary with "verified" and "unverified" lists, each holding
+            the same device dictionaries as get_verified_devices and
+            get_unverified_devices respectively
+        """
+        devices_by_status: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        if not self.client.olm:
+            logger.warning("Encryption not enabled, cannot get devices")
+            return {"verified": [], "unverified": []}
+
         try:
             if hasattr(self.client, "device_store") and self.client.device_store:
                 for user_id in self.client.device_store.users:
@@ -186,20 +227,24 @@ class DeviceVerificationManager:
                         # Skip our own device
                         if user_id == self.client.user_id and device_id == self.client.device_id:
                             continue
-                        # Only include unverified devices
-                        if not getattr(device, "verified", False):
-                            unverified_devices.append(
-                                {
-                                    "user_id": user_id,
-                                    "device_id": device_id,
-                                    "device_name": getattr(device, "display_name", "Unknown"),
-                                    "device": device,
-                                }
-                            )
+                        info = {
+                            "user_id": user_id,
+                            "device_id": device_id,
+                            "device_name": getattr(device, "display_name", "Unknown"),
+                            "device": device,
+                        }
+                        if getattr(device, "verified", False):
+                            info["trust_state"] = getattr(device, "trust_state", None)
+                            devices_by_status["verified"].append(info)
+                        else:
+                            devices_by_status["unverified"].append(info)
         except Exception as e:
-            logger.error(f"Error getting unverified devices: {e}")
+            logger.error(f"Error getting devices by status: {e}")
 
-        return unverified_devices
+        return {
+            "verified": devices_by_status["verified"],
+            "unverified": devices_by_status["unverified"],
+        }
 
     async def get_pending_verifications(self) -> List[Dict[str, Any]]:
         """Get list of pending verification requests.
@@ -209,37 +254,54 @@ class DeviceVerificationManager:
             user_id, device_id, type, and verification object
         """
         pending = []
+        key_verifications = getattr(self.client, "key_verifications", None) or {}
 
-        if hasattr(self.client, "key_verifications") and self.client.key_verifications:
-            for (
-                transaction_id,
-                verification,
-            ) in self.client.key_verifications.items():
-                # For Sas verifications, user_id and device_id are in other_olm_device
-                if Sas and isinstance(verification, Sas):
-                    other_device = getattr(verification, "other_olm_device", None)
-                    if other_device:
-                        user_id = getattr(other_device, "user_id", "Unknown")
-                        device_id = getattr(other_device, "id", "Unknown")
-                    else:
-                        user_id = "Unknown"
-                        device_id = "Unknown"
-                else:
-                    user_id = getattr(verification, "user_id", "Unknown")
-                    device_id = getattr(verification, "device_id", "Unknown")
+        # Describe each verification once; polls only pay for new ones
+        for transaction_id, verification in key_verifications.items():
+            info = self._pending_info.get(transaction_id)
+            if info is None or info["verification"] is not verification:
+                info = self._describe_verification(transaction_id, verification)
+                self._pending_info[transaction_id] = info
+            pending.append(info)
 
-                pending.append(
-                    {
-                        "transaction_id": transaction_id,
-                        "user_id": user_id,
-                        "device_id": device_id,
-                        "type": type(verification).__name__,
-                        "verification": verification,
-                    }
-                )
+        for transaction_id in self._pending_info.keys() - key_verifications.keys():
+            del self._pending_info[transaction_id]
 
         return pending
 
+    @staticmethod
+    def _describe_verification(transaction_id: str, verification: Any) -> Dict[str, Any]:
+        """Build the pending verification entry for a verification object.
+
+        Args:
+            transaction_id: Verification transaction ID
+            verification: Verification object from client.key_verifications
+
+        Returns:
+            Dictionary with transaction_id, user_id, device_id, type, and
+            verification object
+        """
+        # For Sas verifications, user_id and device_id are in other_olm_device
+        if Sas and isinstance(verification, Sas):
+            other_device = getattr(verification, "other_olm_device", None)
+            if other_device:
+                user_id = getattr(other_device, "user_id", "Unknown")
+                device_id = getattr(other_device, "id", "Unknown")
+            else:
+                user_id = "Unknown"
+                device_id = "Unknown"
+        else:
+            user_id = getattr(verification, "user_id", "Unknown")
+            device_id = getattr(verification, "device_id", "Unknown")
+
+        return {
+            "transaction_id": transaction_id,
+            "user_id": user_id,
+            "device_id": device_id,
+            "type": type(verification).__name__,
+            "verification": verification,
+        }
+
     async def start_verification(self, device: Any) -> Optional[Any]:
         """Start SAS verification with a device.
 
@@ -264,18 +326,13 @@ class DeviceVerificationManager:
             # Send the start message to the other device
             await self.client.send_to_device_messages()
 
-            # Wait for the verification to be set up
-            await asyncio.sleep(1)
-
-            # Get the SAS object from the client
-            if hasattr(self.client, "key_verifications"):
-                for (
-                    transaction_id,
-                    verification,
-                ) in self.client.key_verifications.items():
-                    if Sas and isinstance(verification, Sas):
-                        if verification.other_olm_device == device:
-                            return verification
+            # The SAS object is registered locally by start_key_verification,
+            # so it can be looked up straight away
+            key_verifications = getattr(self.client, "key_verifications", None) or {}
+            for verification in key_verifications.values():
+                if Sas and isinstance(verification, Sas):
+                    if verification.other_olm_device == device:
+                        return verification
 
             logger.warning("Verification started, but could not retrieve SAS object")
             return None
@@ -299,10 +356,9 @@ class DeviceVerificationManager:
 
         try:
             if not sas.we_started_it and SasState and sas.state == SasState.created:
+                # accept_key_verification sends the accept message itself; any
+                # follow-up to-device messages are flushed by the sync loop
                 await self.client.accept_key_verification(sas.transaction_id)
-                # Send the accept message to the other device
-                await self.client.send_to_device_messages()
-                await asyncio.sleep(0.5)
                 return True
             return True
         except Exception as e:
@@ -319,13 +375,35 @@ class DeviceVerificationManager:
         Returns:
             True if key exchange completed, False if timeout
         """
-        wait_time = 0
-        while not sas.other_key_set and wait_time < max_wait:
-            await asyncio.sleep(0.5)
-            wait_time += 0.5
+        if sas.other_key_set:
+            return True
+
+        key_event = asyncio.Event()
+        self._key_waiters[sas.transaction_id] = (sas, key_event)
+        try:
+            await asyncio.wait_for(key_event.wait(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._key_waiters.pop(sas.transaction_id, None)
 
         return sas.other_key_set
 
+    async def _on_sync_response(self, response: Any) -> None:
+        """Wake waiters whose key exchange finished or was cancelled.
+
+        Response callbacks run after nio has applied the sync's verification
+        events to the SAS objects, so their state is current here.
+
+        Args:
+            response: Sync response just processed by the client
+        """
+        if not self._key_waiters:
+            return
+        for sas, key_event in self._key_waiters.values():
+            if sas.other_key_set or getattr(sas, "canceled", False):
+                key_event.set()
+
     async def get_emoji_list(self, sas: Any) -> Optional[List[Tuple[str, str]]]:
         """Get emoji list from SAS verification.
 
@@ -482,17 +560,16 @@ class DeviceVerificationManager:
                     )
                     return False
 
-                if (
-                    hasattr(self.client, "key_verifications")
-                    and transaction_id in self.client.key_verifications
-                ):
-                    sas = self.client.key_verifications[transaction_id]
-                    if Sas and isinstance(sas, Sas):
-                        logger.debug(
-                            f"Found SAS verification object for {transaction_id} "
-                            f"after {waited:.1f}s"
-                        )
-                        break
+                # key_verifications is a property on nio clients, so read
+                # it once per attempt rather than once per check
+                key_verifications = getattr(self.client, "key_verifications", None) or {}
+                sas = key_verifications.get(transaction_id)
+                if Sas and isinstance(sas, Sas):
+                    logger.debug(
+                        f"Found SAS verification object for {transaction_id} "
+                        f"after {waited:.1f}s"
+                    )
+                    break
 
                 await asyncio.sleep(retry_interval)
                 waited += retry_interval
@@ -520,9 +597,8 @@ class DeviceVerificationManager:
                 return False
 
             # Accept the verification request
+            # accept_key_verification sends the accept message itself
             await self.client.accept_key_verification(transaction_id)
-            # Send the accept message to the other device
-            await self.client.send_to_device_messages()
             logger.info(f"Auto-accepted verification request {transaction_id}")
 
             # Wait for key exchange
@@ -679,14 +755,14 @@ class DeviceVerificationManager:
         else:
             return await self.reject_verification(sas)
 
-    async def cross_verify_with_bots(self, room_members: List[str]) -> int:
+    async def cross_verify_with_bots(self, room_members: Iterable[str]) -> int:
         """Cross-verify with other ChatrixCD bots in a room.
 
         This method identifies other ChatrixCD bots and automatically starts
         verification with their devices.
 
         Args:
-            room_members: List of user IDs in the room
+            room_members: User IDs in the room (any iterable, e.g. room.users)
 
         Returns:
             Number of verification requests started
@@ -695,16 +771,17 @@ class DeviceVerificationManager:
             logger.warning("SAS verification not available, cannot cross-verify")
             return 0
 
-        # Find potential bot users
-        potential_bots = []
+        # Find potential bot users (a set, as it is probed once per device below)
+        potential_bots = set()
         for user_id in room_members:
+            lowered = user_id.lower()
             if (
-                "chatrix" in user_id.lower()
-                or "sparkles" in user_id.lower()
-                or "opsbot" in user_id.lower()
-                or "bot" in user_id.lower()
+                "chatrix" in lowered
+                or "sparkles" in lowered
+                or "opsbot" in lowered
+                or "bot" in lowered
             ):
-                potential_bots.append(user_id)
+                potential_bots.add(user_id)
 
         if len(potential_bots) <= 1:
             logger.debug("No other potential bots found for cross-verification")
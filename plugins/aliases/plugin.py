@@ -21,6 +21,8 @@ class AliasesPlugin(Plugin):
         # Use the bot's command prefix if provided; default to !cd
         self.command_prefix = config.get("command_prefix", "!cd")
         self.reserved_commands = config.get("reserved_commands", [])
+        # Set view of reserved_commands for O(1) membership checks
+        self._reserved_set = frozenset(self.reserved_commands)
         self.aliases: Dict[str, str] = {}
         self._file_watcher: Optional[FileWatcher] = None
 
@@ -122,7 +124,7 @@ class AliasesPlugin(Plugin):
 
     def add_alias(self, alias: str, command: str) -> bool:
         """Add or update an alias."""
-        if alias.lower() in self.reserved_commands:
+        if alias.lower() in self._reserved_set:
             self.logger.warning(
                 f"Cannot create alias '{alias}': conflicts with built-in command"
             )
@@ -135,7 +137,7 @@ class AliasesPlugin(Plugin):
 
         # Validate that the base command (first token) is reserved/known.
         # Allow arbitrary additional switches/args after the command.
-        base_parts = normalized.split()
+        base_parts = normalized.split(None, 1)
         if not base_parts:
             self.logger.warning(
                 f"Cannot create alias '{alias}': empty command provided"
@@ -143,7 +145,7 @@ class AliasesPlugin(Plugin):
             return False
 
         base_cmd = base_parts[0].lower()
-        if base_cmd not in self.reserved_commands:
+        if base_cmd not in self._reserved_set:
             self.logger.warning(
                 f"Cannot create alias '{alias}': unknown command '{base_cmd}'"
             )
@@ -173,10 +175,10 @@ class AliasesPlugin(Plugin):
 
     def validate_command(self, command: str) -> bool:
         """Validate that a command is a valid bot command."""
-        parts = command.strip().split()
+        parts = command.split(None, 1)
         if not parts:
             return False
-        return parts[0].lower() in self.reserved_commands
+        return parts[0].lower() in self._reserved_set
 
     async def register_tui_screens(self, registry, tui_app):
         """Register TUI screens for this plugin.
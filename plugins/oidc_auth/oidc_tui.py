@@ -124,11 +124,10 @@ class OIDCAuthScreen(ModalScreen):
 
             # Show available identity providers if multiple
             if self.identity_providers and len(self.identity_providers) > 1:
-                providers_text = "Available Identity Providers:\n"
-                for i, idp in enumerate(self.identity_providers, 1):
-                    providers_text += (
-                        f"  {i}. {idp.get('name', idp.get('id', 'Unknown'))}\n"
-                    )
+                providers_text = "Available Identity Providers:\n" + "".join(
+                    f"  {i}. {idp.get('name', idp.get('id', 'Unknown'))}\n"
+                    for i, idp in enumerate(self.identity_providers, 1)
+                )
                 yield Static(providers_text, classes="provider-list")
 
             yield Static(
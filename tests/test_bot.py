@@ -95,6 +95,16 @@ class TestChatrixBot(unittest.TestCase):
         self.assertGreaterEqual(bot.start_time, before_time)
         self.assertLessEqual(bot.start_time, after_time)
 
+    def test_status_uptime_ignores_wall_clock_changes(self):
+        """Test uptime is measured on the monotonic clock."""
+        bot = ChatrixBot(self.config)
+        bot._start_monotonic -= 5
+
+        with patch("chatrixcd.bot.time.time", return_value=0):
+            status = bot.get_status_info()
+
+        self.assertGreaterEqual(status["uptime"], 5000)
+
     def test_init_registers_callbacks(self):
         """Test that bot initialization registers event callbacks."""
         bot = ChatrixBot(self.config)
@@ -147,6 +147,32 @@ class TestCLI(unittest.TestCase):
         args = parser.parse_args(["-s"])
         self.assertTrue(args.show_config)
 
+    def test_print_config_redacts_nested_secrets(self):
+        """Test --show-config output redacts secrets at any depth."""
+        import json
+        from unittest.mock import Mock
+        from chatrixcd.main import print_config
+
+        config = Mock()
+        config.config = {
+            "matrix": {"password": "hunter2", "user_id": "@bot:example.com"},
+            "plugins": [{"auth": {"api_token": "abc123"}}],
+            "webhook": {"webhook_secret": "s3cr3t"},
+        }
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            print_config(config)
+
+        output = fake_out.getvalue()
+        self.assertNotIn("hunter2", output)
+        self.assertNotIn("abc123", output)
+        self.assertNotIn("s3cr3t", output)
+        self.assertIn("@bot:example.com", output)
+        # The original config is left untouched
+        self.assertEqual(config.config["matrix"]["password"], "hunter2")
+        self.assertEqual(config.config["plugins"][0]["auth"]["api_token"], "abc123")
+        json.loads(output.split("=" * 60)[2])
+
     def test_admin_users_flag(self):
         """Test --admin flag."""
         import argparse
@@ -642,6 +642,36 @@ class TestCommandHandler(unittest.TestCase):
         self.assertIn("Logs for Task", call_args[1])
         # Note: Format changed with refactoring - no longer includes "Task output logs"
 
+    def test_tail_logs_fetches_status_and_output_concurrently(self):
+        """Test each tailing poll requests status and logs together."""
+        in_flight = []
+        peak = []
+
+        def tracked(result):
+            async def fetch(*args):
+                in_flight.append(args)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0)
+                in_flight.pop()
+                return result
+
+            return fetch
+
+        self.mock_semaphore.get_task_status = tracked({"status": "success"})
+        self.mock_semaphore.get_task_output = tracked("done")
+        self.handler.log_tailing_sessions["!test:example.com"] = {"task_id": 123}
+
+        with patch.object(self.handler, "_send_log_chunk", new=AsyncMock()) as send_chunk:
+            self.loop.run_until_complete(
+                self.handler.tail_logs("!test:example.com", 123, 1)
+            )
+
+        self.assertEqual(max(peak), 2)
+        send_chunk.assert_awaited_once_with(
+            "!test:example.com", 123, "done", final=True
+        )
+        self.assertNotIn("!test:example.com", self.handler.log_tailing_sessions)
+
     def test_get_logs_empty(self):
         """Test logs retrieval with no logs."""
         # Add task to active tasks
@@ -6,7 +6,7 @@ import unittest
 import sys
 import json
 from io import StringIO
-from chatrixcd.config import Config, CURRENT_CONFIG_VERSION
+from chatrixcd.config import Config, CURRENT_CONFIG_VERSION, _split_key
 
 
 class TestConfig(unittest.TestCase):
@@ -51,6 +51,32 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.get("nonexistent.key", "default"), "default")
         self.assertIsNone(config.get("nonexistent.key"))
 
+    def test_set_creates_sections_and_bumps_version(self):
+        """Test set() writes a dotted key and bumps the config version."""
+        config = Config("nonexistent.json")
+        version = config.version
+
+        config.set("bot.redact", True)
+        config.set("extra.section.value", 1)
+
+        self.assertTrue(config.get("bot.redact"))
+        self.assertEqual(config.get("extra.section.value"), 1)
+        self.assertEqual(config.version, version + 2)
+
+        config.load_config()
+        self.assertEqual(config.version, version + 3)
+
+    def test_dotted_key_split_is_cached(self):
+        """Test dot-separated keys are split once and reused."""
+        _split_key.cache_clear()
+        config = Config("nonexistent.json")
+
+        config.get("matrix.homeserver")
+        config.get("matrix.homeserver")
+
+        self.assertEqual(_split_key("matrix.homeserver"), ("matrix", "homeserver"))
+        self.assertEqual(_split_key.cache_info().misses, 1)
+
     def test_unreadable_config_file(self):
         """Test graceful handling of unreadable config file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
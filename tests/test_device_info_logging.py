@@ -2,7 +2,7 @@
 
 import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from chatrixcd.bot import ChatrixBot
 from chatrixcd.config import Config
@@ -104,6 +104,20 @@ class TestDeviceInfoLogging(unittest.TestCase):
             # Verify logger.info was NOT called (no encryption)
             mock_logger.info.assert_not_called()
 
+    def test_device_fingerprint_read_once(self):
+        """Test the fingerprint is read from the olm account only once."""
+        bot = ChatrixBot(self.config, mode="daemon")
+
+        mock_olm = MagicMock()
+        identity_keys = PropertyMock(return_value={"ed25519": "CACHED_FINGERPRINT"})
+        type(mock_olm.account).identity_keys = identity_keys
+
+        with patch.object(bot.client, "olm", mock_olm):
+            self.assertEqual(bot.get_device_fingerprint(), "CACHED_FINGERPRINT")
+            self.assertEqual(bot.get_device_fingerprint(), "CACHED_FINGERPRINT")
+
+        identity_keys.assert_called_once()
+
     def test_log_device_info_tui_mode_not_called(self):
         """Test that device info is not logged in TUI mode."""
         # Create bot in TUI mode
@@ -262,6 +262,65 @@ class TestSemaphoreClient(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result["status"], "running")
 
+    def test_get_task_status_caches_finished_tasks(self):
+        """Test finished task status is served without another request."""
+
+        async def mock_json():
+            return {"id": 123, "status": "success"}
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = mock_json
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get = MagicMock(
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
+        )
+        mock_session.close = AsyncMock()
+
+        self.client.session = mock_session
+        first = self.loop.run_until_complete(self.client.get_task_status(1, 123))
+        second = self.loop.run_until_complete(self.client.get_task_status(1, 123))
+
+        self.assertEqual(second, first)
+        self.assertEqual(mock_session.get.call_count, 1)
+
+        # Tasks not yet seen finishing are fetched from the API
+        self.loop.run_until_complete(self.client.get_task_status(1, 124))
+        self.assertEqual(mock_session.get.call_count, 2)
+
+    def test_finished_task_cache_is_bounded_and_copied(self):
+        """Test the finished task cache evicts old entries and hands out copies."""
+
+        async def mock_json():
+            return {"id": 123, "status": "success"}
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = mock_json
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get = MagicMock(
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
+        )
+        mock_session.close = AsyncMock()
+        self.client.session = mock_session
+
+        with patch("chatrixcd.semaphore.FINISHED_TASK_CACHE_SIZE", 2):
+            first = self.loop.run_until_complete(self.client.get_task_status(1, 1))
+            first["status"] = "edited"
+            self.assertEqual(
+                self.loop.run_until_complete(self.client.get_task_status(1, 1))["status"],
+                "success",
+            )
+
+            self.loop.run_until_complete(self.client.get_task_status(1, 2))
+            self.loop.run_until_complete(self.client.get_task_status(1, 3))
+
+        self.assertEqual(list(self.client._finished_tasks), [(1, 2), (1, 3)])
+
     def test_get_task_status_failure(self):
         """Test task status retrieval failure."""
         mock_response = MagicMock()
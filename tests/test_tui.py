@@ -50,6 +50,28 @@ class TestTUIImport(unittest.TestCase):
                 f"{screen_class.__name__} missing __init__",
             )
 
+    def test_import_tui_defers_crypto_modules(self):
+        """Test that importing the TUI does not load nio or the verification stack."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, chatrixcd.tui; "
+            "print(','.join(m for m in ('nio', 'qrcode', 'chatrixcd.verification') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            timeout=60,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
 
 class TestTUICreation(unittest.TestCase):
     """Test TUI object creation."""
@@ -93,6 +115,61 @@ class TestTUICreation(unittest.TestCase):
         # TUI no longer has its own metrics - they're in bot.metrics
         self.assertEqual(tui.errors, 0)  # Only errors remain in TUI
 
+    def test_themed_css_shared_between_instances(self):
+        """Test the formatted CSS is built once per theme and reused."""
+        from chatrixcd.tui import ChatrixTUI
+
+        first = ChatrixTUI(Mock(), Mock(), theme="midnight")
+        second = ChatrixTUI(Mock(), Mock(), theme="midnight")
+        unknown = ChatrixTUI(Mock(), Mock(), theme="no-such-theme")
+
+        self.assertIs(first.CSS, second.CSS)
+        self.assertIn(ChatrixTUI.THEMES["midnight"]["background"], first.CSS)
+        self.assertIs(unknown.CSS, ChatrixTUI._themed_css("default"))
+
+    def test_color_system_built_once_per_app(self):
+        """Test the theme's ColorSystem is built once, not rebuilt for CSS."""
+        from chatrixcd.tui import ChatrixTUI
+        from chatrixcd.tui import app as app_module
+
+        with patch.object(
+            app_module, "ColorSystem", wraps=app_module.ColorSystem
+        ) as mock_color_system:
+            tui = ChatrixTUI(Mock(), Mock(), use_color=True, theme="midnight")
+
+        mock_color_system.assert_called_once()
+        self.assertIsNotNone(tui.design)
+
+    def test_css_variables_generated_once_per_design(self):
+        """Test CSS variables are regenerated only when the design changes."""
+        from chatrixcd.tui import ChatrixTUI
+
+        tui = ChatrixTUI(Mock(), Mock(), theme="midnight")
+        with patch.object(tui.design, "generate", wraps=tui.design.generate) as mock_generate:
+            first = tui.get_css_variables()
+            second = tui.get_css_variables()
+
+        mock_generate.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        tui._apply_theme("grayscale")
+        self.assertEqual(tui.get_css_variables(), tui.design.generate())
+        self.assertNotEqual(tui.get_css_variables(), first)
+
+    def test_theme_variable_defaults_cached_per_theme(self):
+        """Test theme defaults are cached but handed out as fresh copies."""
+        from chatrixcd.tui import ChatrixTUI
+
+        tui = ChatrixTUI(Mock(), Mock(), theme="grayscale")
+        defaults = tui.get_theme_variable_defaults()
+        self.assertEqual(defaults["background"], ChatrixTUI.THEMES["grayscale"]["background"])
+
+        defaults["background"] = "#123456"
+        again = tui.get_theme_variable_defaults()
+        self.assertIsNot(again, defaults)
+        self.assertEqual(again["background"], ChatrixTUI.THEMES["grayscale"]["background"])
+
 
 class TestTUIScreens(unittest.TestCase):
     """Test TUI screen creation."""
@@ -115,7 +192,7 @@ class TestTUIScreens(unittest.TestCase):
             {"id": "!room1:example.com", "name": "Room 1"},
             {"id": "!room2:example.com", "name": "Room 2"},
         ]
-        screen = RoomsScreen(rooms)
+        screen = RoomsScreen(rooms=rooms)
 
         self.assertIsNotNone(screen)
         self.assertEqual(screen.rooms, rooms)
@@ -149,6 +226,35 @@ class TestBotStatusWidget(unittest.TestCase):
         self.assertEqual(widget.errors, 0)
         self.assertEqual(widget.emojis_used, 0)
 
+    def test_status_widget_has_no_instance_dict(self):
+        """Test the shim uses slots rather than a per-instance __dict__."""
+        from chatrixcd.tui import BotStatusWidget
+
+        widget = BotStatusWidget()
+
+        self.assertFalse(hasattr(widget, "__dict__"))
+        with self.assertRaises(AttributeError):
+            widget.unknown_metric = 1
+
+
+class TestMetricDisplay(unittest.TestCase):
+    """Test MetricDisplay widget."""
+
+    def test_render_reuses_label_markup(self):
+        """Test the label markup is rebuilt only when icon or label change."""
+        from chatrixcd.tui.widgets.common import MetricDisplay
+
+        metric = MetricDisplay(label="Uptime", value=1, icon="⏱️")
+        self.assertEqual(metric.render(), "[bold]⏱️ Uptime:[/bold] 1")
+        prefix = metric._prefix
+
+        metric.value = 2
+        self.assertEqual(metric.render(), "[bold]⏱️ Uptime:[/bold] 2")
+        self.assertIs(metric._prefix, prefix)
+
+        metric.label = "Up"
+        self.assertEqual(metric.render(), "[bold]⏱️ Up:[/bold] 2")
+
 
 class TestCLIIntegration(unittest.TestCase):
     """Test CLI integration with TUI."""
@@ -470,7 +576,7 @@ class TestTUIStartupWithPlugins(unittest.TestCase):
             )
             # Should be able to instantiate the screen
             try:
-                screen = registration.screen_class(tui)
+                screen = registration.resolve_screen_class()(tui)
                 self.assertIsNotNone(screen)
             except Exception as e:
                 self.fail(f"Failed to instantiate screen '{screen_name}': {e}")
@@ -109,6 +109,30 @@ class TestScreenRegistry(unittest.TestCase):
         self.assertEqual(registration.name, "test_screen")
         self.assertEqual(registration.title, "Test Screen")
 
+    def test_resolve_screen_class_from_import_path(self):
+        """Test a screen registered by import path resolves on first use."""
+        from chatrixcd.tui.screens.logs import LogsScreen
+
+        self.registry.register(
+            name="logs",
+            screen_class="chatrixcd.tui.screens.logs:LogsScreen",
+            title="Logs",
+        )
+
+        registration = self.registry.get("logs")
+        self.assertIs(registration.resolve_screen_class(), LogsScreen)
+        self.assertIs(registration.screen_class, LogsScreen)
+
+    def test_registration_has_no_instance_dict(self):
+        """Test screen registrations store their fields in slots."""
+        self.registry.register(
+            name="test_screen",
+            screen_class=self.mock_screen_class,
+            title="Test Screen",
+        )
+
+        self.assertFalse(hasattr(self.registry.get("test_screen"), "__dict__"))
+
     def test_get_screen_by_key(self):
         """Test getting a screen by key binding."""
         self.registry.register(
@@ -143,6 +167,35 @@ class TestScreenRegistry(unittest.TestCase):
         self.assertEqual(screens[0].name, "screen2")  # priority 10
         self.assertEqual(screens[1].name, "screen1")  # priority 20
 
+    def test_get_all_order_maintained_across_unregister(self):
+        """Test the menu order index stays sorted as screens come and go."""
+        for name, priority, category in [
+            ("c", 30, "core"),
+            ("a", 10, "plugins"),
+            ("b", 10, "core"),
+            ("d", 20, "plugins"),
+        ]:
+            self.registry.register(
+                name=name,
+                screen_class=Mock(),
+                title=name.upper(),
+                priority=priority,
+                category=category,
+            )
+
+        self.assertEqual([s.name for s in self.registry.get_all()], ["a", "b", "d", "c"])
+
+        self.registry.unregister("b")
+        self.registry.unregister("d")
+
+        self.assertEqual([s.name for s in self.registry.get_all()], ["a", "c"])
+        self.assertEqual([s.name for s in self.registry.get_all(category="core")], ["c"])
+        self.assertEqual(self.registry.get_categories(), ["core", "plugins"])
+
+        self.registry.unregister("c")
+        self.assertEqual(self.registry.get_all(category="core"), [])
+        self.assertEqual(self.registry.get_categories(), ["plugins"])
+
     def test_get_screens_by_category(self):
         """Test filtering screens by category."""
         self.registry.register(
@@ -232,6 +285,14 @@ class TestScreenRegistry(unittest.TestCase):
         categories = self.registry.get_categories()
         self.assertEqual(set(categories), {"core", "plugins"})
 
+        # Adding to an existing category reuses the cached names
+        cached = self.registry._sorted_categories
+        self.registry.register(name="screen4", screen_class=Mock(), title="S4", category="core")
+        self.assertIs(self.registry._sorted_categories, cached)
+
+        self.registry.register(name="screen5", screen_class=Mock(), title="S5", category="admin")
+        self.assertEqual(self.registry.get_categories(), ["admin", "core", "plugins"])
+
 
 class TestEvents(unittest.TestCase):
     """Test TUI events."""
@@ -267,6 +328,20 @@ class TestEvents(unittest.TestCase):
         self.assertEqual(event.message, "Test notification")
         self.assertEqual(event.severity, "warning")
 
+    def test_events_have_no_instance_dict(self):
+        """Test events store their fields in slots."""
+        events = [
+            TUIEvent(source="test"),
+            ScreenChangeEvent(screen_name="new_screen"),
+            DataUpdateEvent(data_type="connection", data={}),
+            PluginLoadedEvent(plugin_name="test_plugin", plugin_type="generic"),
+            NotificationEvent(message="Test notification"),
+        ]
+
+        for event in events:
+            with self.subTest(event=type(event).__name__):
+                self.assertFalse(hasattr(event, "__dict__"))
+
 
 class TestBaseScreen(unittest.IsolatedAsyncioTestCase):
     """Test base screen functionality."""
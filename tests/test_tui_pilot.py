@@ -4,15 +4,22 @@ Tests interactive workflows using Textual's pilot testing framework.
 """
 
 import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 from chatrixcd.tui.app import ChatrixTUI
+from chatrixcd.tui.events import PluginLoadedEvent
 from chatrixcd.tui.screens.config import ConfigScreen
 from chatrixcd.tui.screens.logs import LogsScreen
 from chatrixcd.tui.screens.main_menu import MainMenuScreen
 from chatrixcd.tui.screens.rooms import RoomsScreen
 from chatrixcd.tui.screens.status import StatusScreen
+from chatrixcd.tui.screens.verification import VerificationScreen
 
 
 class TestTUINavigation(unittest.IsolatedAsyncioTestCase):
@@ -60,6 +67,45 @@ class TestTUINavigation(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(app.config, self.mock_config)
         self.assertIsNotNone(app.screen_registry)
 
+    async def test_unbound_key_is_ignored(self):
+        """Test keys without a registered screen return without pushing."""
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+        event = Mock(key="z")
+
+        with patch.object(app, "push_screen") as mock_push:
+            await app.on_key(event)
+
+        mock_push.assert_not_called()
+        event.stop.assert_not_called()
+
+    async def test_bound_key_pushes_screen_before_stack_exists(self):
+        """Test a bound key still pushes its screen when no screen is active."""
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+        event = Mock(key="s")
+
+        # Textual raises ScreenStackError for app.screen until a screen is pushed
+        with self.assertRaises(Exception):
+            app.screen
+
+        with patch.object(app, "push_screen") as mock_push:
+            await app.on_key(event)
+
+        self.assertIsInstance(mock_push.call_args.args[0], StatusScreen)
+        event.stop.assert_called_once()
+
+    async def test_menu_button_opens_registered_screen(self):
+        """Test pressing a menu button navigates to its registered screen."""
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.pause()
+
+            button = app.screen.query_one("#menu-rooms")
+            await app.screen.on_button_pressed(Mock(button=button))
+            await pilot.pause()
+
+            self.assertIsInstance(app.screen, RoomsScreen)
+
     async def test_main_menu_displays(self):
         """Test main menu screen displays."""
         app = ChatrixTUI(self.mock_bot, self.mock_config)
@@ -278,6 +324,14 @@ class TestRoomsScreen(unittest.IsolatedAsyncioTestCase):
             # Should be on rooms screen
             self.assertIsInstance(app.screen, RoomsScreen)
 
+            # Refreshing replaces the rows rather than appending to them
+            await app.screen.refresh_data()
+            table = app.screen.query_one("#rooms-table")
+            self.assertEqual(table.row_count, 1)
+            self.assertEqual(
+                table.get_row_at(0), ["Test Room", "!room123:example.com", "2", "Yes"]
+            )
+
 
 class TestConfigScreen(unittest.IsolatedAsyncioTestCase):
     """Test config screen functionality."""
@@ -320,6 +374,337 @@ class TestConfigScreen(unittest.IsolatedAsyncioTestCase):
             # Should be on config screen
             self.assertIsInstance(app.screen, ConfigScreen)
 
+    async def test_edit_mode_toggles_controls(self):
+        """Test edit mode unlocks the editor and save/discard buttons."""
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async with app.run_test(size=(80, 30)) as pilot:
+            await pilot.pause()
+            await pilot.press("c")
+            await pilot.pause()
+
+            screen = app.screen
+            await screen.toggle_edit_mode()
+            self.assertFalse(screen.query_one("#config-content").read_only)
+            self.assertFalse(screen.query_one("#save-button").disabled)
+
+            await screen.toggle_edit_mode()
+            self.assertTrue(screen.query_one("#config-content").read_only)
+            self.assertTrue(screen.query_one("#discard-button").disabled)
+
+    async def test_buttons_dispatch_to_handlers(self):
+        """Test each config button is routed to its handler."""
+        screen = ConfigScreen(Mock())
+
+        for button_id, handler in ConfigScreen._BUTTON_HANDLERS.items():
+            with patch.object(screen, handler) as mock_handler:
+                await screen.on_button_pressed(Mock(button=Mock(id=button_id)))
+                mock_handler.assert_called_once()
+
+    def test_config_text_cached_until_config_reloaded(self):
+        """Test redacted config text is reused until the config dict changes."""
+        tui_app = Mock()
+        tui_app.config.config = {"matrix": {"password": "secret"}}
+        first = ConfigScreen(tui_app)._render_config_text()
+
+        self.assertIn("***REDACTED***", first)
+        self.assertNotIn("secret", first)
+        with patch("chatrixcd.tui.screens.config.json.dumps") as dumps:
+            self.assertIs(ConfigScreen(tui_app)._render_config_text(), first)
+            dumps.assert_not_called()
+
+        # Redaction works on copies, never on the live config
+        self.assertEqual(tui_app.config.config["matrix"]["password"], "secret")
+
+        # load_config() swaps in a new dict, which invalidates the cache
+        tui_app.config.config = {"matrix": {"user_id": "@bot:example.com"}}
+        self.assertIn("@bot:example.com", ConfigScreen(tui_app)._render_config_text())
+
+    def test_config_text_rerendered_after_in_place_change(self):
+        """Test changing the live config dict in place re-renders the text."""
+        from chatrixcd.config import Config
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = Config(os.path.join(tmp_dir, "missing.json"))
+        tui_app = Mock(config=config)
+        bot_section = config.config["bot"]
+
+        first = ConfigScreen(tui_app)._render_config_text()
+        self.assertNotIn('"redact": true', first)
+
+        config.set("bot.redact", True)
+        self.assertIs(config.config["bot"], bot_section)
+        self.assertIn('"redact": true', ConfigScreen(tui_app)._render_config_text())
+
+    def test_config_json_matches_stdlib_layout(self):
+        """Test config JSON keeps the stdlib layout whichever encoder runs."""
+        from chatrixcd.tui.screens.config import _dump_config_json
+
+        config_dict = {"matrix": {"user_id": "@bot:example.com", "rooms": [1, 2]}}
+        self.assertEqual(_dump_config_json(config_dict), json.dumps(config_dict, indent=2))
+
+        # Values orjson rejects fall back to the stdlib encoder
+        self.assertEqual(_dump_config_json({1: "one"}), json.dumps({1: "one"}, indent=2))
+
+    async def test_discard_skips_reload_when_text_unchanged(self):
+        """Test discarding an unedited config does not reload the text area."""
+        tui_app = Mock()
+        tui_app.config.config = {"matrix": {"user_id": "@bot:example.com"}}
+        screen = ConfigScreen(tui_app)
+        text_area = Mock(text=screen._render_config_text())
+
+        with patch.object(screen, "query_one", return_value=text_area), patch.object(
+            screen, "refresh_data", new_callable=AsyncMock
+        ) as refresh, patch.object(
+            screen, "toggle_edit_mode", new_callable=AsyncMock
+        ), patch.object(
+            screen, "show_notification", new_callable=AsyncMock
+        ):
+            await screen.discard_changes()
+            refresh.assert_not_called()
+
+            text_area.text = "{}"
+            await screen.discard_changes()
+            refresh.assert_called_once()
+
+            # A reloaded config goes through refresh_data, never a render here
+            text_area.text = screen._render_config_text()
+            tui_app.config.config = {"matrix": {"user_id": "@other:example.com"}}
+            with patch.object(screen, "_render_config_text") as render:
+                await screen.discard_changes()
+                render.assert_not_called()
+            self.assertEqual(refresh.call_count, 2)
+
+    async def test_refresh_skips_reload_when_text_current(self):
+        """Test refreshing an unchanged config leaves the text area alone."""
+        tui_app = Mock()
+        tui_app.config.config = {"matrix": {"user_id": "@bot:example.com"}}
+        screen = ConfigScreen(tui_app)
+        text_area = Mock(text=screen._render_config_text(), load_text=AsyncMock())
+
+        with patch.object(screen, "query_one", return_value=text_area):
+            await screen.refresh_data()
+            text_area.load_text.assert_not_called()
+
+            text_area.text = "{}"
+            await screen.refresh_data()
+            text_area.load_text.assert_awaited_once()
+
+    async def test_save_changes_replaces_config_file(self):
+        """Test saving writes the edited JSON and leaves no temp file behind."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "config.json")
+            with open(config_file, "w") as f:
+                f.write("{}")
+
+            tui_app = Mock()
+            tui_app.config.config_file = config_file
+            reload_threads = []
+            tui_app.config.load_config.side_effect = lambda: reload_threads.append(
+                threading.current_thread()
+            )
+            screen = ConfigScreen(tui_app)
+
+            with patch.object(
+                screen, "query_one", return_value=Mock(text='{"bot": {"verbosity": "debug"}}')
+            ), patch.object(screen, "show_success", new_callable=AsyncMock), patch.object(
+                screen, "refresh_data", new_callable=AsyncMock
+            ), patch.object(
+                screen, "toggle_edit_mode", new_callable=AsyncMock
+            ):
+                await screen.save_changes()
+
+            with open(config_file) as f:
+                self.assertEqual(json.load(f), {"bot": {"verbosity": "debug"}})
+            self.assertEqual(os.listdir(tmp_dir), ["config.json"])
+            # The config is reloaded on the event loop, not in the writer thread
+            self.assertEqual(reload_threads, [threading.main_thread()])
+
+    def test_write_config_keeps_file_mode(self):
+        """Test the replaced config keeps its restrictive mode under umask 0."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "config.json")
+            with open(config_file, "w") as f:
+                f.write("{}")
+            os.chmod(config_file, 0o600)
+
+            screen = ConfigScreen(Mock())
+            old_umask = os.umask(0)
+            try:
+                screen._write_config('{"bot": {}}', config_file)
+            finally:
+                os.umask(old_umask)
+
+            self.assertEqual(os.stat(config_file).st_mode & 0o777, 0o600)
+
+    def test_write_config_removes_temp_file_on_failure(self):
+        """Test a failed replace leaves the original config and no temp file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "config.json")
+            with open(config_file, "w") as f:
+                f.write("{}")
+
+            screen = ConfigScreen(Mock())
+            with patch("chatrixcd.tui.screens.config.os.replace", side_effect=OSError("boom")):
+                with self.assertRaises(OSError):
+                    screen._write_config('{"bot": {}}', config_file)
+
+            self.assertEqual(os.listdir(tmp_dir), ["config.json"])
+            with open(config_file) as f:
+                self.assertEqual(f.read(), "{}")
+
+    async def test_save_changes_rejects_invalid_json(self):
+        """Test invalid JSON is reported and the config file is left alone."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "config.json")
+            with open(config_file, "w") as f:
+                f.write("{}")
+
+            tui_app = Mock()
+            tui_app.config.config_file = config_file
+            screen = ConfigScreen(tui_app)
+
+            with patch.object(
+                screen, "query_one", return_value=Mock(text="{not json")
+            ), patch.object(screen, "show_error", new_callable=AsyncMock) as show_error:
+                await screen.save_changes()
+
+            self.assertIn("Invalid JSON", show_error.call_args.args[0])
+            with open(config_file) as f:
+                self.assertEqual(f.read(), "{}")
+            tui_app.config.load_config.assert_not_called()
+
+
+class TestLogsScreen(unittest.TestCase):
+    """Test logs screen functionality."""
+
+    def test_load_logs_reads_tail_newest_first(self):
+        """Test only the last lines are returned, most recent first."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            f.writelines(f"line {i} \u2713\n" for i in range(500))
+            log_file = f.name
+
+        try:
+            tui_app = Mock()
+            tui_app.config.get_bot_config.return_value = {"log_file": log_file}
+            screen = LogsScreen(tui_app)
+
+            # Small blocks force several backwards reads, some splitting
+            # multi-byte characters
+            with patch("chatrixcd.tui.screens.logs.LOG_BLOCK_SIZE", 37):
+                content = screen._load_logs(max_lines=10)
+
+            expected = "".join(f"line {i} \u2713\n" for i in range(499, 489, -1))
+            self.assertEqual(content, expected)
+            self.assertEqual(screen._load_logs(max_lines=1000).count("\n"), 500)
+        finally:
+            os.unlink(log_file)
+
+    def test_load_logs_reads_only_appended_lines(self):
+        """Test later loads read just the new lines, finishing partial ones."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            f.write("first\nsecond\nthi")
+            log_file = f.name
+
+        try:
+            tui_app = Mock()
+            tui_app.config.get_bot_config.return_value = {"log_file": log_file}
+
+            self.assertEqual(
+                LogsScreen(tui_app)._load_logs(max_lines=3), "thisecond\nfirst\n"
+            )
+
+            with open(log_file, "a") as f:
+                f.write("rd\nfourth\n")
+
+            with patch.object(LogsScreen, "_read_tail") as read_tail:
+                content = LogsScreen(tui_app)._load_logs(max_lines=3)
+                read_tail.assert_not_called()
+            self.assertEqual(content, "fourth\nthird\nsecond\n")
+
+            # A truncated (rotated) file is read again from scratch
+            with open(log_file, "w") as f:
+                f.write("fresh\n")
+            self.assertEqual(LogsScreen(tui_app)._load_logs(max_lines=3), "fresh\n")
+        finally:
+            os.unlink(log_file)
+
+    def test_load_logs_normalizes_crlf_only(self):
+        """Test CRLF endings become newlines and bare carriage returns stay."""
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".log", delete=False) as f:
+            f.write(b"first\r\nprogress 50%\rprogress 100%\r\n")
+            log_file = f.name
+
+        try:
+            tui_app = Mock()
+            tui_app.config.get_bot_config.return_value = {"log_file": log_file}
+
+            self.assertEqual(
+                LogsScreen(tui_app)._load_logs(max_lines=10),
+                "progress 50%\rprogress 100%\nfirst\n",
+            )
+
+            with open(log_file, "ab") as f:
+                f.write(b"appended\r\n")
+            self.assertEqual(
+                LogsScreen(tui_app)._load_logs(max_lines=10),
+                "appended\nprogress 50%\rprogress 100%\nfirst\n",
+            )
+        finally:
+            os.unlink(log_file)
+
+    def test_overlapping_loads_do_not_duplicate_lines(self):
+        """Test concurrent loads each apply appended lines only once."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            f.write("first\n")
+            log_file = f.name
+
+        try:
+            tui_app = Mock()
+            tui_app.config.get_bot_config.return_value = {"log_file": log_file}
+            LogsScreen(tui_app)._load_logs(max_lines=10)
+
+            with open(log_file, "a") as f:
+                f.write("second\n")
+
+            # Widen the window between reading the offset and updating it
+            class SlowFile:
+                def __init__(self, f):
+                    self._f = f
+                    self.fileno = f.fileno
+                    self.seek = f.seek
+
+                def read(self, size):
+                    time.sleep(0.05)
+                    return self._f.read(size)
+
+            def load():
+                with open(log_file, "rb") as f:
+                    LogsScreen._read_new_lines(SlowFile(f), log_file, 10)
+
+            threads = [threading.Thread(target=load) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(LogsScreen(tui_app)._load_logs(max_lines=10), "second\nfirst\n")
+        finally:
+            os.unlink(log_file)
+
+
+class TestVerificationScreen(unittest.IsolatedAsyncioTestCase):
+    """Test verification screen functionality."""
+
+    async def test_action_buttons_dispatch_to_handlers(self):
+        """Test each action button is routed to its handler."""
+        screen = VerificationScreen(Mock())
+
+        for _, button_id, _, handler in VerificationScreen.ACTION_BUTTONS:
+            with patch.object(screen, handler) as mock_handler:
+                await screen.on_button_pressed(Mock(button=Mock(id=button_id)))
+                mock_handler.assert_called_once()
+
 
 class TestPluginIntegration(unittest.IsolatedAsyncioTestCase):
     """Test plugin TUI integration."""
@@ -350,6 +735,48 @@ class TestPluginIntegration(unittest.IsolatedAsyncioTestCase):
             # App should initialize without error
             self.assertIsNotNone(app.screen_registry)
 
+    async def test_plugin_screens_load_in_background(self):
+        """Test a slow plugin doesn't hold up the main menu."""
+        release = asyncio.Event()
+
+        async def register_tui_screens(registry, tui_app):
+            await release.wait()
+
+        plugin = Mock(register_tui_screens=AsyncMock(side_effect=register_tui_screens))
+        self.mock_plugin_manager.loaded_plugins = {"slow_plugin": plugin}
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async def run():
+            async with app.run_test(size=(80, 30)) as pilot:
+                await pilot.pause()
+
+                self.assertIsInstance(app.screen, MainMenuScreen)
+                plugin.register_tui_screens.assert_awaited_once_with(app.screen_registry, app)
+
+                release.set()
+                await app.workers.wait_for_complete()
+
+        # Startup would never finish if mounting waited on the plugin
+        await asyncio.wait_for(run(), timeout=10)
+
+    async def test_plugin_loaded_event_registers_only_that_plugin(self):
+        """Test a plugin load only registers screens for the new plugin."""
+        existing = Mock(register_tui_screens=AsyncMock())
+        added = Mock(register_tui_screens=AsyncMock())
+        self.mock_plugin_manager.loaded_plugins = {"existing": existing}
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async with app.run_test(size=(80, 30)) as pilot:
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+
+            self.mock_plugin_manager.loaded_plugins["added"] = added
+            await app.on_plugin_loaded_event(PluginLoadedEvent("added", "generic"))
+            await app.workers.wait_for_complete()
+
+        existing.register_tui_screens.assert_awaited_once()
+        added.register_tui_screens.assert_awaited_once_with(app.screen_registry, app)
+
     async def test_plugin_screens_can_be_registered(self):
         """Test that plugin screens can be registered."""
         app = ChatrixTUI(self.mock_bot, self.mock_config)
@@ -9,7 +9,7 @@ This test suite focuses on interactive workflows such as:
 
 import unittest
 import asyncio
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 from chatrixcd.tui import (
     ChatrixTUI,
     AliasesScreen,
@@ -64,6 +64,87 @@ class TestAliasManagementWorkflow(unittest.IsolatedAsyncioTestCase):
             screen = app.screen
             self.assertIsInstance(screen, AliasesScreen)
 
+    async def test_alias_screen_tracks_highlighted_alias(self):
+        """Test that moving the table cursor updates the selected alias."""
+        self.mock_alias_plugin.list_aliases.return_value = {
+            "deploy": "run 1 5",
+            "check": "status 123",
+        }
+        self.mock_bot.plugin_manager.loaded_plugins = {"aliases": self.mock_alias_plugin}
+
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.press("x")
+            await pilot.pause()
+
+            screen = app.screen
+            self.assertIsInstance(screen, AliasesScreen)
+            self.assertEqual(screen.query_one("#aliases-table").row_count, 2)
+            self.assertEqual(screen.selected_alias, "deploy")
+
+            screen.query_one("#data-table").focus()
+            await pilot.press("down")
+            await pilot.pause()
+            self.assertEqual(screen.selected_alias, "check")
+
+    async def test_alias_screen_delete_removes_single_row(self):
+        """Test that deleting an alias removes only its row."""
+        self.mock_alias_plugin.list_aliases.return_value = {
+            "deploy": "run 1 5",
+            "check": "status 123",
+        }
+        self.mock_bot.plugin_manager.loaded_plugins = {"aliases": self.mock_alias_plugin}
+
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.press("x")
+            await pilot.pause()
+
+            screen = app.screen
+            self.assertEqual(screen.selected_alias, "deploy")
+            self.mock_alias_plugin.list_aliases.reset_mock()
+
+            await screen.delete_selected_alias()
+            await pilot.pause()
+
+            self.mock_alias_plugin.remove_alias.assert_called_once_with("deploy")
+            self.mock_alias_plugin.list_aliases.assert_not_called()
+            table = screen.query_one("#data-table")
+            self.assertEqual([key.value for key in table.rows], ["check"])
+
+    async def test_alias_screen_refresh_applies_only_changes(self):
+        """Test refreshing keeps unchanged rows and patches the rest."""
+        self.mock_alias_plugin.list_aliases.return_value = {
+            "deploy": "run 1 5",
+            "check": "status 123",
+        }
+        self.mock_bot.plugin_manager.loaded_plugins = {"aliases": self.mock_alias_plugin}
+
+        app = ChatrixTUI(self.mock_bot, self.mock_config)
+
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.press("x")
+            await pilot.pause()
+
+            screen = app.screen
+            grid = screen.query_one("#aliases-table")
+            self.mock_alias_plugin.list_aliases.return_value = {
+                "deploy": "run 1 6",
+                "logs": "logs 123",
+            }
+
+            with patch.object(grid, "clear") as mock_clear:
+                await screen.refresh_data()
+            await pilot.pause()
+
+            mock_clear.assert_not_called()
+            table = screen.query_one("#data-table")
+            self.assertEqual([key.value for key in table.rows], ["deploy", "logs"])
+            self.assertEqual(table.get_row("deploy")[1], "run 1 6")
+            self.assertEqual(grid.row_count, 2)
+
     async def test_alias_screen_keyboard_navigation(self):
         """Test alias screen keyboard navigation."""
         self.mock_alias_plugin.list_aliases.return_value = {}
@@ -1,9 +1,11 @@
 """Tests for device verification module."""
 
+import asyncio
 import unittest
 import tempfile
 import os
 from unittest.mock import Mock, patch
+from nio import AsyncClient
 from chatrixcd.verification import DeviceVerificationManager, SAS_AVAILABLE
 
 
@@ -55,6 +57,25 @@ class TestDeviceVerificationManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(devices[0]["device_id"], "DEVICE1")
         self.assertEqual(devices[0]["device_name"], "Device 1")
 
+    async def test_get_devices_by_status(self):
+        """Test get_devices_by_status splits devices in a single pass."""
+        mock_device_store = Mock()
+        user_devices = {
+            "DEVICE1": Mock(verified=False, display_name="Device 1"),
+            "DEVICE2": Mock(verified=True, display_name="Device 2", trust_state="verified"),
+        }
+        mock_device_store.users = {"@user1:example.com": user_devices}
+        mock_device_store.__getitem__ = Mock(return_value=user_devices)
+
+        self.mock_client.device_store = mock_device_store
+
+        devices = await self.manager.get_devices_by_status()
+
+        self.assertEqual([d["device_id"] for d in devices["verified"]], ["DEVICE2"])
+        self.assertEqual(devices["verified"][0]["trust_state"], "verified")
+        self.assertEqual([d["device_id"] for d in devices["unverified"]], ["DEVICE1"])
+        self.assertNotIn("trust_state", devices["unverified"][0])
+
     async def test_get_pending_verifications(self):
         """Test get_pending_verifications."""
         # Mock key verifications
@@ -73,6 +94,47 @@ class TestDeviceVerificationManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(pending[0]["user_id"], "@user:example.com")
         self.assertEqual(pending[0]["device_id"], "DEVICE1")
 
+    async def test_get_pending_verifications_reuses_entries(self):
+        """Test pending entries are built once per verification and pruned."""
+        mock_sas = Mock(user_id="@user:example.com", device_id="DEVICE1")
+        self.mock_client.key_verifications = {"txn1": mock_sas}
+
+        first = await self.manager.get_pending_verifications()
+        second = await self.manager.get_pending_verifications()
+        self.assertIs(second[0], first[0])
+
+        self.mock_client.key_verifications = {}
+        self.assertEqual(await self.manager.get_pending_verifications(), [])
+        self.assertEqual(self.manager._pending_info, {})
+
+    async def test_wait_for_key_exchange_woken_by_sync(self):
+        """Test that a sync response wakes a pending key exchange wait."""
+        sas = Mock(transaction_id="txn1", other_key_set=False, canceled=False)
+
+        waiter = asyncio.create_task(self.manager.wait_for_key_exchange(sas, max_wait=5))
+        await asyncio.sleep(0)
+
+        sas.other_key_set = True
+        await self.manager._on_sync_response(Mock())
+
+        self.assertTrue(await asyncio.wait_for(waiter, timeout=1))
+        self.mock_client.add_response_callback.assert_called_once()
+        self.assertEqual(self.manager._key_waiters, {})
+
+    async def test_sync_callback_registered_once_per_manager(self):
+        """Test one sync callback serves every key exchange wait."""
+        client = AsyncClient("https://matrix.example.com", "@bot:example.com")
+        manager = DeviceVerificationManager(client)
+        self.assertEqual(len(client.response_callbacks), 1)
+
+        for transaction_id in ("txn2", "txn3"):
+            sas = Mock(transaction_id=transaction_id, other_key_set=False, canceled=False)
+            self.assertFalse(await manager.wait_for_key_exchange(sas, max_wait=0.01))
+
+        self.assertEqual(len(client.response_callbacks), 1)
+        self.assertEqual(manager._key_waiters, {})
+        await client.close()
+
     async def test_start_verification_no_sas(self):
         """Test start_verification when SAS is not available."""
         with patch("chatrixcd.verification.SAS_AVAILABLE", False):